@@ -15,16 +15,20 @@ and date-stamped outputs for weekly digests.
 from __future__ import annotations
 
 import argparse
+import gzip
 import json
 import os
+import sqlite3
 import sys
+import threading
 import time
-from datetime import datetime, timedelta, timezone
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from datetime import date, datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 from urllib.parse import urlencode
 from urllib.request import Request, urlopen
-import xml.etree.ElementTree as ET
 
 try:
     from dotenv import load_dotenv
@@ -32,6 +36,40 @@ try:
 except ImportError:
     print("⚠️  python-dotenv not installed. Install with: pip install python-dotenv", file=sys.stderr)
 
+# lxml parses MEDLINE XML in C (optional, falls back to the stdlib parser)
+try:
+    from lxml import etree as ET
+    LXML_AVAILABLE = True
+except ImportError:
+    import xml.etree.ElementTree as ET  # type: ignore[no-redef]
+    LXML_AVAILABLE = False
+
+# orjson serialises JSON natively (optional, falls back to the stdlib json module)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+    ORJSON_AVAILABLE = False
+
+# requests keeps HTTPS connections alive across calls (optional, falls back to urllib)
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+    REQUESTS_AVAILABLE = True
+except ImportError:
+    requests = None  # type: ignore[assignment]
+    HTTPAdapter = None  # type: ignore[assignment,misc]
+    REQUESTS_AVAILABLE = False
+
+# zstandard compresses the dated archive for --compress (optional)
+try:
+    import zstandard as zstd
+    ZSTD_AVAILABLE = True
+except ImportError:
+    zstd = None  # type: ignore[assignment]
+    ZSTD_AVAILABLE = False
+
 
 # -------------------------
 # Specialty Config Loader
@@ -50,7 +88,7 @@ def get_config_value(config: Dict[str, Any], key: str, default: Any = None) -> A
     return config.get(key, default)
 
 # Publication types to prioritize (original research and reviews)
-PRIORITY_PUB_TYPES = {
+PRIORITY_PUB_TYPES = frozenset({
     "Clinical Trial",
     "Randomized Controlled Trial",
     "Multicenter Study",
@@ -59,10 +97,10 @@ PRIORITY_PUB_TYPES = {
     "Observational Study",
     "Comparative Study",
     "Review",
-}
+})
 
 # Publication types to exclude (non-substantive content)
-EXCLUDE_PUB_TYPES = {
+EXCLUDE_PUB_TYPES = frozenset({
     "Editorial",
     "Comment",
     "Letter",
@@ -73,115 +111,344 @@ EXCLUDE_PUB_TYPES = {
     "Clinical Study Protocol",
     "Clinical Trial Protocol",
     "Study Protocol",
-}
+})
+
+# Title phrases that mark a protocol paper rather than results
+PROTOCOL_TITLE_PHRASES = (
+    "study protocol",
+    "trial protocol",
+    "protocol for",
+    ": protocol",
+    "protocol of",
+    "research protocol",
+)
 
 EUTILS_BASE = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/"
 TOOL_NAME = "cardiology-research-digest"
 
+# Longer esearch URLs are sent as a form POST instead (NCBI advises POST for long terms)
+ESEARCH_MAX_GET_URL = 2000
+# PubMed esearch only returns the first 10,000 records of a query, however it is paged
+ESEARCH_MAX_RECORDS = 10000
+
+# NCBI E-utilities allow 3 requests/second without an API key, 10 with one
+NCBI_MAX_RPS = 3
+NCBI_MAX_RPS_WITH_KEY = 10
+
+
+class RateLimiter:
+    """Thread-safe limiter that spaces calls to at most `rate` per second."""
+
+    def __init__(self, rate: float) -> None:
+        self.interval = 1.0 / rate
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    def wait(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+HTTP_POOL_SIZE = 8
+
+
+def _make_http_session() -> Any:
+    """Shared session so every E-utilities call reuses pooled keep-alive connections."""
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE))
+    session.headers["User-Agent"] = f"{TOOL_NAME}/1.0"
+    # PubMed XML compresses several-fold; requests decodes it transparently
+    session.headers["Accept-Encoding"] = "gzip, deflate"
+    return session
+
+
+HTTP_SESSION = _make_http_session() if REQUESTS_AVAILABLE else None
+
+
+class ChunkReader:
+    """Minimal file-like wrapper over an iterator of byte chunks (enough for iterparse)."""
+
+    def __init__(self, chunks: Iterator[bytes], on_close: Any = None) -> None:
+        self._chunks = chunks
+        self._buffer = b""
+        self._on_close = on_close
+
+    def read(self, size: int = -1) -> bytes:
+        if size is None or size < 0:
+            data = self._buffer + b"".join(self._chunks)
+            self._buffer = b""
+            return data
+        while len(self._buffer) < size:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                break
+            self._buffer += chunk
+        data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
+
+    def close(self) -> None:
+        if self._on_close is not None:
+            self._on_close()
+            self._on_close = None
+
+    def __enter__(self) -> "ChunkReader":
+        return self
 
-def http_get(url: str, timeout: int = 30, headers: Optional[Dict[str, str]] = None) -> bytes:
-    hdrs = {"User-Agent": f"{TOOL_NAME}/1.0"}
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+
+FORM_HEADERS = {"Content-Type": "application/x-www-form-urlencoded"}
+
+
+def encode_params(params: Dict[str, str]) -> str:
+    """URL-encode E-utilities parameters, leaving commas in id lists unescaped (valid in a query)."""
+    return urlencode(params, safe=",")
+
+
+def http_open(
+    url: str,
+    timeout: int = 30,
+    headers: Optional[Dict[str, str]] = None,
+    data: Optional[Dict[str, str]] = None,
+) -> Any:
+    """
+    Open a request and return a file-like streaming response (caller closes it).
+
+    Sends a form-encoded POST when data is given, otherwise a GET.
+    """
+    if HTTP_SESSION is not None:
+        if data is not None:
+            resp = HTTP_SESSION.post(
+                url, data=encode_params(data), headers={**FORM_HEADERS, **(headers or {})}, timeout=timeout, stream=True
+            )
+        else:
+            resp = HTTP_SESSION.get(url, headers=headers, timeout=timeout, stream=True)
+        try:
+            resp.raise_for_status()
+        except Exception:
+            resp.close()
+            raise
+        # Consuming via iter_content lets the connection return to the pool on close
+        return ChunkReader(resp.iter_content(chunk_size=64 * 1024), on_close=resp.close)
+
+    hdrs = {"User-Agent": f"{TOOL_NAME}/1.0", "Accept-Encoding": "gzip"}
     if headers:
         hdrs.update(headers)
-    req = Request(url, headers=hdrs)
-    with urlopen(req, timeout=timeout) as resp:
+    body = encode_params(data).encode("utf-8") if data is not None else None
+    req = Request(url, data=body, headers=hdrs)
+    resp = urlopen(req, timeout=timeout)
+    if resp.headers.get("Content-Encoding", "").lower() != "gzip":
+        return resp
+    # urllib does not decode gzip itself; decompress incrementally as the caller reads
+    gz = gzip.GzipFile(fileobj=resp)
+    return ChunkReader(iter(lambda: gz.read(64 * 1024), b""), on_close=resp.close)
+
+
+def http_get(
+    url: str,
+    timeout: int = 30,
+    headers: Optional[Dict[str, str]] = None,
+    data: Optional[Dict[str, str]] = None,
+) -> bytes:
+    """Fetch a whole response body via http_open."""
+    with http_open(url, timeout=timeout, headers=headers, data=data) as resp:
         return resp.read()
 
 
+def parse_xml(xml_bytes: bytes) -> ET.Element:
+    """Parse an E-utilities XML response with the fastest available backend."""
+    if LXML_AVAILABLE:
+        parser = ET.XMLParser(huge_tree=True, collect_ids=False, remove_blank_text=True)
+        return ET.fromstring(xml_bytes, parser=parser)
+    return ET.fromstring(xml_bytes)
+
+
+def iter_pubmed_articles(source: Any) -> Iterator[ET.Element]:
+    """
+    Stream PubmedArticle elements from a file-like efetch response.
+
+    Each article is yielded once fully parsed and freed as soon as the caller
+    moves on, so memory stays at roughly one article instead of the whole batch.
+    """
+    if LXML_AVAILABLE:
+        context = ET.iterparse(
+            source, events=("end",), tag="PubmedArticle",
+            huge_tree=True, collect_ids=False, remove_blank_text=True,
+        )
+        for _, article in context:
+            yield article
+            article.clear(keep_tail=True)
+            while article.getprevious() is not None:
+                del article.getparent()[0]
+        return
+
+    root = None
+    for event, elem in ET.iterparse(source, events=("start", "end")):
+        if root is None:
+            root = elem
+        elif event == "end" and elem.tag == "PubmedArticle":
+            yield elem
+            root.clear()
+
+
 def build_journal_query(journals: List[str]) -> str:
-    parts = [f'"{j}"[jour]' for j in journals]
-    return "(" + " OR ".join(parts) + ")"
+    return "(" + " OR ".join(f'"{j}"[jour]' for j in journals) + ")"
 
 
 def build_general_journal_cardiology_query(journals: List[str], mesh_terms: List[str], title_keywords: List[str]) -> str:
     """Build query for general journals filtered by cardiology MeSH terms or title keywords."""
-    journal_part = "(" + " OR ".join([f'"{j}"[jour]' for j in journals]) + ")"
-    mesh_part = "(" + " OR ".join([f'"{m}"[MeSH]' for m in mesh_terms]) + ")"
-    title_part = "(" + " OR ".join([f'{k}[ti]' for k in title_keywords]) + ")"
+    journal_part = build_journal_query(journals)
+    mesh_part = "(" + " OR ".join(f'"{m}"[MeSH]' for m in mesh_terms) + ")"
+    title_part = "(" + " OR ".join(f'{k}[ti]' for k in title_keywords) + ")"
     cardiology_filter = f"({mesh_part} OR {title_part})"
     return f"({journal_part} AND {cardiology_filter})"
 
 
-def esearch_pmids(
+def _esearch(
     query: str,
     days: int,
-    max_results: int,
+    extra: Dict[str, str],
     api_key: Optional[str],
     email: str,
-    retstart: int = 0,
-) -> Tuple[List[str], int]:
-    end = datetime.now(timezone.utc).date()
-    start = (datetime.now(timezone.utc) - timedelta(days=days)).date()
+    limiter: Optional[RateLimiter] = None,
+    today: Optional[date] = None,
+) -> ET.Element:
+    """Run one esearch over the `days` days up to today (UTC) and return the parsed eSearchResult."""
+    end = today or datetime.now(timezone.utc).date()
+    start = end - timedelta(days=days)
 
     params = {
         "db": "pubmed",
         "term": f'{query} AND ("{start}"[dp] : "{end}"[dp])',
         "retmode": "xml",
-        "retmax": str(max_results),
-        "retstart": str(retstart),
-        "sort": "pub+date",
         "tool": TOOL_NAME,
         "email": email,
+        **extra,
     }
     if api_key:
         params["api_key"] = api_key
 
-    url = EUTILS_BASE + "esearch.fcgi?" + urlencode(params)
-    xml_bytes = http_get(url)
-    root = ET.fromstring(xml_bytes)
+    url = EUTILS_BASE + "esearch.fcgi?" + encode_params(params)
+    if limiter:
+        limiter.wait()
+    if len(url) > ESEARCH_MAX_GET_URL:
+        xml_bytes = http_get(EUTILS_BASE + "esearch.fcgi", data=params)
+    else:
+        xml_bytes = http_get(url)
+    root = parse_xml(xml_bytes)
+
+    error = root.findtext("ERROR")
+    if error:
+        print(f"⚠️  esearch error: {error}", file=sys.stderr)
+    return root
 
-    count_text = root.findtext("Count") or "0"
-    count = int(count_text)
 
+def esearch_count(
+    query: str,
+    days: int,
+    api_key: Optional[str],
+    email: str,
+    limiter: Optional[RateLimiter] = None,
+    today: Optional[date] = None,
+) -> int:
+    """Return the number of records matching query, without fetching any ids."""
+    root = _esearch(query, days, {"rettype": "count"}, api_key, email, limiter=limiter, today=today)
+    return int(root.findtext("Count") or "0")
+
+
+def esearch_pmids(
+    query: str,
+    days: int,
+    max_results: int,
+    api_key: Optional[str],
+    email: str,
+    limiter: Optional[RateLimiter] = None,
+    today: Optional[date] = None,
+) -> Tuple[List[str], int]:
+    """
+    Return up to max_results PMIDs for query over the `days` days up to today (UTC), plus the total hit count.
+
+    A count-only probe runs first, so an empty window costs one tiny response and
+    the id request asks for no more than actually match. PubMed serves at most
+    the first ESEARCH_MAX_RECORDS ids of a query.
+    """
+    count = esearch_count(query, days, api_key, email, limiter=limiter, today=today)
+    if count > ESEARCH_MAX_RECORDS and max_results >= ESEARCH_MAX_RECORDS:
+        print(f"⚠️  Query matched {count:,} records; PubMed only returns the first {ESEARCH_MAX_RECORDS:,}",
+              file=sys.stderr)
+
+    retmax = min(max_results, count, ESEARCH_MAX_RECORDS)
+    if retmax <= 0:
+        return [], count
+
+    root = _esearch(
+        query, days, {"retmax": str(retmax), "sort": "pub+date"}, api_key, email, limiter=limiter, today=today
+    )
     pmids = [elem.text for elem in root.findall("./IdList/Id") if elem.text]
     return pmids, count
 
 
-def chunked(lst: List[str], n: int) -> List[List[str]]:
-    return [lst[i: i + n] for i in range(0, len(lst), n)]
+def chunked(lst: List[str], n: int) -> Iterator[List[str]]:
+    for i in range(0, len(lst), n):
+        yield lst[i: i + n]
 
 
 def _text(elem: Optional[ET.Element]) -> str:
     if elem is None:
         return ""
+    if len(elem) == 0:
+        # Leaf (most titles, journal names, abstract sections): no markup to flatten
+        return (elem.text or "").strip()
+    if LXML_AVAILABLE:
+        # Serialised in C, without the generator + join round trip
+        return ET.tostring(elem, method="text", encoding="unicode", with_tail=False).strip()
     return "".join(elem.itertext()).strip()
 
 
-def parse_pubdate(article: ET.Element) -> str:
-    y = article.findtext(".//ArticleDate/Year")
-    m = article.findtext(".//ArticleDate/Month")
-    d = article.findtext(".//ArticleDate/Day")
-    if y and m and d:
-        return f"{y}-{m.zfill(2)}-{d.zfill(2)}"
+def parse_pubdate(article_date: Optional[ET.Element], pub_date: Optional[ET.Element]) -> str:
+    """Format a publication date from the ArticleDate and JournalIssue/PubDate elements."""
+    if article_date is not None:
+        y = article_date.findtext("Year")
+        m = article_date.findtext("Month")
+        d = article_date.findtext("Day")
+        if y and m and d:
+            return f"{y}-{m.zfill(2)}-{d.zfill(2)}"
 
-    y = article.findtext(".//JournalIssue/PubDate/Year")
-    m = article.findtext(".//JournalIssue/PubDate/Month")
-    d = article.findtext(".//JournalIssue/PubDate/Day")
+    if pub_date is None:
+        return ""
+    y = pub_date.findtext("Year")
+    m = pub_date.findtext("Month")
+    d = pub_date.findtext("Day")
     if y and m and d:
-        mm = month_to_number(m)
-        return f"{y}-{mm.zfill(2)}-{d.zfill(2)}"
+        return f"{y}-{month_to_number(m)}-{d.zfill(2)}"
     if y and m:
-        mm = month_to_number(m)
-        return f"{y}-{mm.zfill(2)}"
+        return f"{y}-{month_to_number(m)}"
     if y:
         return y
-    medline_date = article.findtext(".//JournalIssue/PubDate/MedlineDate")
+    medline_date = pub_date.findtext("MedlineDate")
     return medline_date or ""
 
 
+# PubMed month token (numeral, possibly zero-padded, or English name) -> two-digit month
+MONTH_NUMBERS = {
+    **{str(i): f"{i:02d}" for i in range(1, 13)},
+    **{f"{i:02d}": f"{i:02d}" for i in range(1, 10)},
+    "Jan": "01", "Feb": "02", "Mar": "03", "Apr": "04", "May": "05", "Jun": "06",
+    "Jul": "07", "Aug": "08", "Sep": "09", "Oct": "10", "Nov": "11", "Dec": "12",
+}
+
+
 def month_to_number(m: str) -> str:
-    m = m.strip()
-    if m.isdigit():
-        return m
-    mapping = {
-        "Jan": "1", "Feb": "2", "Mar": "3", "Apr": "4", "May": "5", "Jun": "6",
-        "Jul": "7", "Aug": "8", "Sep": "9", "Oct": "10", "Nov": "11", "Dec": "12",
-    }
-    return mapping.get(m[:3], "0")
+    return MONTH_NUMBERS.get(m.strip()[:3], "00")
 
 
-def parse_abstract(article: ET.Element) -> str:
-    abs_elems = article.findall(".//Abstract/AbstractText")
+def parse_abstract(abs_elems: List[ET.Element]) -> str:
+    """Join AbstractText sections, prefixing each with its label when present."""
     if not abs_elems:
         return ""
     chunks: List[str] = []
@@ -199,11 +466,13 @@ def parse_abstract(article: ET.Element) -> str:
 
 def classify_article(pub_types: List[str], has_abstract: bool, title: str = "") -> str:
     """Classify article based on publication type, content availability, and title."""
-    pub_types_set = set(pub_types)
-
-    # Check for excluded types first
-    if pub_types_set & EXCLUDE_PUB_TYPES:
-        return "excluded"
+    # Single pass over the (short) pub type list: excluded types win immediately
+    is_priority = False
+    for pt in pub_types:
+        if pt in EXCLUDE_PUB_TYPES:
+            return "excluded"
+        if pt in PRIORITY_PUB_TYPES:
+            is_priority = True
 
     # Filter protocols with missing publication types
     # If "protocol" is in title AND no publication types assigned, exclude it
@@ -213,19 +482,11 @@ def classify_article(pub_types: List[str], has_abstract: bool, title: str = "")
         return "excluded"
 
     # Also exclude if title explicitly indicates it's a protocol paper
-    protocol_phrases = [
-        "study protocol",
-        "trial protocol",
-        "protocol for",
-        ": protocol",
-        "protocol of",
-        "research protocol",
-    ]
-    if any(phrase in title_lower for phrase in protocol_phrases):
+    if any(phrase in title_lower for phrase in PROTOCOL_TITLE_PHRASES):
         return "excluded"
 
     # Check for priority research types
-    if pub_types_set & PRIORITY_PUB_TYPES:
+    if is_priority:
         return "priority" if has_abstract else "priority_no_abstract"
 
     # Has abstract but generic type
@@ -236,33 +497,89 @@ def classify_article(pub_types: List[str], has_abstract: bool, title: str = "")
     return "low_priority"
 
 
-def parse_article(article: ET.Element) -> Dict[str, Any]:
-    pmid = article.findtext(".//PMID") or ""
-    title = _text(article.find(".//ArticleTitle"))
-    journal = _text(article.find(".//Journal/Title")) or _text(article.find(".//MedlineJournalInfo/MedlineTA"))
-    pub_date = parse_pubdate(article)
-    abstract = parse_abstract(article)
-
-    doi = ""
-    for id_elem in article.findall(".//ArticleIdList/ArticleId"):
-        if id_elem.attrib.get("IdType") == "doi" and id_elem.text:
-            doi = id_elem.text.strip()
-            break
+@dataclass(slots=True)
+class Article:
+    """One parsed PubMed record; field order is the key order of the output JSON."""
+    pmid: str
+    doi: str
+    title: str
+    journal: str
+    pub_date: str
+    abstract: str
+    publication_types: List[str]
+    category: str
+    authors: List[str]
+    url: str
+
+
+def parse_article(article: ET.Element) -> Article:
+    """
+    Extract digest fields from a PubmedArticle in a single walk of its subtree.
+
+    Each field keeps first-match semantics (e.g. the citation's own PMID comes
+    before any CommentsCorrections PMIDs). Path-sensitive fields are read from
+    their container element so OtherAbstract text and reference DOIs are skipped.
+    """
+    pmid: Optional[str] = None
+    title_elem: Optional[ET.Element] = None
+    journal_elem: Optional[ET.Element] = None
+    medline_ta_elem: Optional[ET.Element] = None
+    article_date: Optional[ET.Element] = None
+    pub_date_elem: Optional[ET.Element] = None
+    doi: Optional[str] = None
+    abstract_elems: List[ET.Element] = []
+    pub_types: List[str] = []
+    author_elems: List[ET.Element] = []
+
+    for el in article.iter():
+        tag = el.tag
+        if tag == "PMID":
+            if pmid is None:
+                pmid = (el.text or "").strip()
+        elif tag == "ArticleTitle":
+            if title_elem is None:
+                title_elem = el
+        elif tag == "Journal":
+            if journal_elem is None:
+                journal_elem = el.find("Title")
+        elif tag == "MedlineJournalInfo":
+            if medline_ta_elem is None:
+                medline_ta_elem = el.find("MedlineTA")
+        elif tag == "ArticleDate":
+            if article_date is None:
+                article_date = el
+        elif tag == "JournalIssue":
+            if pub_date_elem is None:
+                pub_date_elem = el.find("PubDate")
+        elif tag == "Abstract":
+            abstract_elems.extend(el.findall("AbstractText"))
+        elif tag == "PubmedData":
+            # Only the article's own id list; ReferenceList entries carry their own DOIs
+            doi = el.findtext("ArticleIdList/ArticleId[@IdType='doi']")
+        elif tag == "PublicationTypeList":
+            for pt_elem in el.findall("PublicationType"):
+                if pt_elem.text:
+                    # Small vocabulary shared across the batch: keep one copy of each
+                    pub_types.append(sys.intern(pt_elem.text.strip()))
+        elif tag == "AuthorList":
+            if len(author_elems) < 3:
+                author_elems.extend(el.findall("Author")[:3 - len(author_elems)])
+
+    pmid = pmid or ""
+    title = _text(title_elem)
+    journal = sys.intern(_text(journal_elem) or _text(medline_ta_elem))
+    pub_date = parse_pubdate(article_date, pub_date_elem)
+    abstract = parse_abstract(abstract_elems)
+    doi = (doi or "").strip()
 
     url = f"https://pubmed.ncbi.nlm.nih.gov/{pmid}/" if pmid else ""
 
-    # Extract publication types
-    pub_types = []
-    for pt_elem in article.findall(".//PublicationTypeList/PublicationType"):
-        if pt_elem.text:
-            pub_types.append(pt_elem.text.strip())
-
     # Classify the article (NOW PASSING TITLE)
     category = classify_article(pub_types, bool(abstract), title)
 
     # Extract authors (first 3)
     authors = []
-    for author_elem in article.findall(".//AuthorList/Author")[:3]:
+    for author_elem in author_elems:
         last = author_elem.findtext("LastName") or ""
         first = author_elem.findtext("ForeName") or ""
         if last and first:
@@ -270,54 +587,149 @@ def parse_article(article: ET.Element) -> Dict[str, Any]:
         elif last:
             authors.append(last)
 
-    return {
-        "pmid": pmid,
-        "doi": doi,
-        "title": title,
-        "journal": journal,
-        "pub_date": pub_date,
-        "abstract": abstract,
-        "publication_types": pub_types,
-        "category": category,
-        "authors": authors,
-        "url": url,
+    return Article(
+        pmid=pmid,
+        doi=doi,
+        title=title,
+        journal=journal,
+        pub_date=pub_date,
+        abstract=abstract,
+        publication_types=pub_types,
+        category=category,
+        authors=authors,
+        url=url,
+    )
+
+
+# -------------------------
+# Parsed article cache
+# -------------------------
+ARTICLE_CACHE_FILENAME = "pubmed_articles.sqlite"
+
+
+def open_article_cache(cache_dir: Path) -> sqlite3.Connection:
+    """Open (creating if needed) the PMID -> parsed article store in cache_dir."""
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(str(cache_dir / ARTICLE_CACHE_FILENAME))
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("CREATE TABLE IF NOT EXISTS articles (pmid TEXT PRIMARY KEY, json BLOB NOT NULL)")
+    return conn
+
+
+def load_cached_articles(conn: sqlite3.Connection, pmids: List[str]) -> Dict[str, Article]:
+    """Return cached articles for the given PMIDs, re-classified with the current rules."""
+    found: Dict[str, Article] = {}
+    # Stay well under SQLite's bound-parameter limit
+    for batch in chunked(pmids, 500):
+        placeholders = ",".join("?" * len(batch))
+        rows = conn.execute(f"SELECT pmid, json FROM articles WHERE pmid IN ({placeholders})", batch)
+        for pmid, blob in rows:
+            try:
+                article = Article(**(orjson.loads(blob) if ORJSON_AVAILABLE else json.loads(blob)))
+            except (TypeError, ValueError):
+                # Unreadable or written with a different field set: refetch it
+                continue
+            article.category = classify_article(article.publication_types, bool(article.abstract), article.title)
+            found[pmid] = article
+    return found
+
+
+def save_cached_articles(conn: sqlite3.Connection, articles: List[Article]) -> None:
+    rows = [
+        (a.pmid, orjson.dumps(a) if ORJSON_AVAILABLE else json.dumps(asdict(a), ensure_ascii=False).encode("utf-8"))
+        for a in articles
+        if a.pmid
+    ]
+    with conn:
+        conn.executemany("INSERT OR REPLACE INTO articles (pmid, json) VALUES (?, ?)", rows)
+
+
+def efetch_params(api_key: Optional[str], email: str) -> Dict[str, str]:
+    """Parameters shared by every efetch batch in a run (the id list is added per batch)."""
+    params = {
+        "db": "pubmed",
+        "retmode": "xml",
+        "tool": TOOL_NAME,
+        "email": email,
     }
+    if api_key:
+        params["api_key"] = api_key
+    return params
+
+
+def _efetch_batch(batch: List[str], base_params: Dict[str, str], limiter: RateLimiter) -> List[Article]:
+    params = {**base_params, "id": ",".join(batch)}
+
+    # POST keeps the id list out of the URL, so batch size is not capped by URL length
+    limiter.wait()
+    with http_open(EUTILS_BASE + "efetch.fcgi", data=params) as resp:
+        return [parse_article(article) for article in iter_pubmed_articles(resp)]
 
 
 def efetch_details(
     pmids: List[str],
     api_key: Optional[str],
     email: str,
-    batch_size: int = 100,
-    sleep_s: float = 0.34,
-) -> List[Dict[str, Any]]:
-    results: List[Dict[str, Any]] = []
-
-    for batch in chunked(pmids, batch_size):
-        params = {
-            "db": "pubmed",
-            "id": ",".join(batch),
-            "retmode": "xml",
-            "tool": TOOL_NAME,
-            "email": email,
-        }
-        if api_key:
-            params["api_key"] = api_key
-
-        url = EUTILS_BASE + "efetch.fcgi?" + urlencode(params)
-        xml_bytes = http_get(url)
-        root = ET.fromstring(xml_bytes)
-
-        for article in root.findall(".//PubmedArticle"):
-            results.append(parse_article(article))
-
-        time.sleep(sleep_s)
-    return results
+    batch_size: int = 200,
+    max_workers: Optional[int] = None,
+    cache_dir: Optional[Path] = None,
+    limiter: Optional[RateLimiter] = None,
+) -> List[Article]:
+    """
+    Fetch and parse article details, running batches concurrently.
+
+    Requests are paced by a shared limiter to stay within the NCBI rate limit,
+    so round trips overlap instead of waiting on a fixed sleep between batches.
+    If cache_dir is given, previously parsed articles are served from a local
+    SQLite store and only unseen PMIDs are fetched.
+    """
+    conn = open_article_cache(cache_dir) if cache_dir else None
+    try:
+        by_pmid = load_cached_articles(conn, pmids) if conn else {}
+        missing = [p for p in pmids if p not in by_pmid]
+
+        fetched: List[Article] = []
+        n_batches = -(-len(missing) // batch_size)
+        if n_batches:
+            limiter = limiter or RateLimiter(NCBI_MAX_RPS_WITH_KEY if api_key else NCBI_MAX_RPS)
+            workers = max_workers or (8 if api_key else 3)
+            base_params = efetch_params(api_key, email)
+            with ThreadPoolExecutor(max_workers=min(workers, n_batches)) as pool:
+                futures = [
+                    pool.submit(_efetch_batch, batch, base_params, limiter)
+                    for batch in chunked(missing, batch_size)
+                ]
+                for future in futures:
+                    fetched.extend(future.result())
+
+        if conn:
+            save_cached_articles(conn, fetched)
+    finally:
+        if conn:
+            conn.close()
+
+    # Cached articles first (in request order), then everything efetch returned
+    return [by_pmid[p] for p in pmids if p in by_pmid] + fetched
+
+
+# (category, include_no_abstract) -> digest bucket
+CATEGORY_BUCKETS: Dict[Tuple[str, bool], str] = {
+    ("excluded", False): "excluded",
+    ("excluded", True): "excluded",
+    ("priority", False): "priority",
+    ("priority", True): "priority",
+    ("priority_no_abstract", False): "excluded",
+    ("priority_no_abstract", True): "needs_review",
+    ("standard", False): "standard",
+    ("standard", True): "standard",
+    ("low_priority", False): "excluded",
+    ("low_priority", True): "needs_review",
+}
 
 
-def filter_and_categorize(articles: List[Dict[str, Any]], include_no_abstract: bool = False) -> Dict[str, List[Dict[str, Any]]]:
+def filter_and_categorize(articles: List[Article], include_no_abstract: bool = False) -> Dict[str, List[Article]]:
     """Filter and categorize articles for digest."""
-    categorized = {
+    categorized: Dict[str, List[Article]] = {
         "priority": [],
         "standard": [],
         "needs_review": [],
@@ -325,24 +737,12 @@ def filter_and_categorize(articles: List[Dict[str, Any]], include_no_abstract: b
     }
 
     for article in articles:
-        cat = article["category"]
-
-        if cat == "excluded":
-            categorized["excluded"].append(article)
-        elif cat == "priority":
-            categorized["priority"].append(article)
-        elif cat == "priority_no_abstract":
-            if include_no_abstract:
-                categorized["needs_review"].append(article)
-            else:
-                categorized["excluded"].append(article)
-        elif cat == "standard":
-            categorized["standard"].append(article)
-        else:  # low_priority
-            if include_no_abstract:
-                categorized["needs_review"].append(article)
-            else:
-                categorized["excluded"].append(article)
+        # Unknown categories are treated like low_priority
+        bucket = CATEGORY_BUCKETS.get(
+            (article.category, include_no_abstract),
+            "needs_review" if include_no_abstract else "excluded",
+        )
+        categorized[bucket].append(article)
 
     return categorized
 
@@ -354,12 +754,13 @@ def load_seen_pmids(state_path: Path) -> set[str]:
     if not state_path.exists():
         return set()
     try:
-        with open(state_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        raw = state_path.read_bytes()
+        data = orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
         pmids = data.get("seen_pmids", [])
         if not isinstance(pmids, list):
             return set()
-        return {str(p).strip() for p in pmids if str(p).strip()}
+        # Written by save_seen_pmids, so entries are already clean PMID strings
+        return set(pmids)
     except Exception:
         # If state file is corrupted, fail safe by not deduping (but do not crash).
         return set()
@@ -371,16 +772,15 @@ def save_seen_pmids(state_path: Path, seen_pmids: set[str]) -> None:
         "updated_at": datetime.now(timezone.utc).isoformat(),
         "seen_pmids": sorted(seen_pmids),
     }
-    with open(state_path, "w", encoding="utf-8") as f:
-        json.dump(payload, f, ensure_ascii=False, indent=2)
+    write_bytes_atomic(state_path, dump_json_bytes(payload))
 
 
-def dedupe_articles_by_pmid(articles: List[Dict[str, Any]], seen_pmids: set[str]) -> Tuple[List[Dict[str, Any]], int]:
+def dedupe_articles_by_pmid(articles: List[Article], seen_pmids: set[str]) -> Tuple[List[Article], int]:
     """Return only articles whose PMID is not in seen_pmids. Also returns count removed."""
-    new_articles: List[Dict[str, Any]] = []
+    new_articles: List[Article] = []
     removed = 0
     for a in articles:
-        pmid = (a.get("pmid") or "").strip()
+        pmid = a.pmid
         if not pmid:
             # If no PMID, keep it (rare) - but it won't be tracked in state
             new_articles.append(a)
@@ -392,6 +792,50 @@ def dedupe_articles_by_pmid(articles: List[Dict[str, Any]], seen_pmids: set[str]
     return new_articles, removed
 
 
+def dump_json_bytes(payload: Dict[str, Any], pretty: bool = True) -> bytes:
+    """Serialise payload as UTF-8 JSON (indented, or compact if not pretty), using orjson when available."""
+    if ORJSON_AVAILABLE:
+        # orjson serialises Article dataclasses natively
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+        return orjson.dumps(payload, option=option)
+    if pretty:
+        return json.dumps(payload, ensure_ascii=False, indent=2, default=asdict).encode("utf-8")
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":"), default=asdict).encode("utf-8")
+
+
+def write_bytes_atomic(path: Path, data: bytes) -> None:
+    """Write data to a sibling temp file, then swap it into place so readers never see a partial file."""
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+def link_or_write_atomic(src: Path, path: Path, data: bytes) -> None:
+    """
+    Point path at src's bytes via a hard link, swapped in atomically.
+
+    Falls back to writing data when hard links are unavailable (e.g. some
+    Windows or network filesystems, or src on another device).
+    """
+    tmp = path.with_name(path.name + ".tmp")
+    try:
+        tmp.unlink(missing_ok=True)
+        os.link(src, tmp)
+    except OSError:
+        write_bytes_atomic(path, data)
+        return
+    os.replace(tmp, path)
+
+
+def write_zstd(path: Path, data: bytes, level: int = 10) -> None:
+    """Stream data through a multi-threaded zstd compressor into path."""
+    cctx = zstd.ZstdCompressor(level=level, threads=-1)
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "wb") as f, cctx.stream_writer(f) as writer:
+        writer.write(data)
+    os.replace(tmp, path)
+
+
 def make_dated_output_path(base_out: Path, run_date: str) -> Path:
     """If base_out is output/foo.json -> output/foo_YYYY-MM-DD.json"""
     suffix = base_out.suffix if base_out.suffix else ".json"
@@ -399,12 +843,12 @@ def make_dated_output_path(base_out: Path, run_date: str) -> Path:
     return base_out.with_name(f"{stem}_{run_date}{suffix}")
 
 
-def main() -> int:
+def main(argv: Optional[List[str]] = None) -> int:
     ap = argparse.ArgumentParser(description="Fetch and filter research articles by specialty")
     ap.add_argument("--specialty", type=str, default="cardiology",
                     help="Specialty to fetch (default: cardiology). Loads config from specialties/{specialty}.json")
     ap.add_argument("--days", type=int, default=7, help="Look back this many days (default: 7)")
-    ap.add_argument("--max", type=int, default=300, help="Max PMIDs to retrieve (default: 300)")
+    ap.add_argument("--max", type=int, default=300, help="Max PMIDs to retrieve per search, up to 10000 (default: 300)")
     ap.add_argument("--out", type=str, default=None,
                     help="Stable output JSON filename. Defaults to output/{specialty}_recent.json")
     ap.add_argument("--include-no-abstract", action="store_true", help="Include articles without abstracts")
@@ -416,7 +860,16 @@ def main() -> int:
                     help="Disable dedupe (always include items even if seen before)")
     ap.add_argument("--test-mode", action="store_true",
                     help="Test mode: skip all state file reading/writing (ignores seen_pmids.json entirely)")
-    args = ap.parse_args()
+    ap.add_argument("--cache-dir", type=str, default=None,
+                    help="Cache parsed articles in this directory so reruns only fetch unseen PMIDs (default: off)")
+    ap.add_argument("--pretty", action="store_true",
+                    help="Indent the output JSON for reading (default: compact, as consumed by the email step)")
+    ap.add_argument("--compress", action="store_true",
+                    help="Write the date-stamped archive as zstd-compressed .json.zst (requires zstandard)")
+    args = ap.parse_args(argv)
+
+    # One clock read per run: search window, run date and generated_at all agree
+    run_dt = datetime.now(timezone.utc)
 
     # Load specialty config
     try:
@@ -477,42 +930,56 @@ def main() -> int:
     general_pmids = []
     general_count = 0
 
-    # Search specialty journals
-    if specialty_query:
-        print("  📚 Specialty journals...")
-        specialty_pmids, specialty_count = esearch_pmids(
-            query=specialty_query,
-            days=args.days,
-            max_results=args.max,
-            api_key=api_key,
-            email=email,
-        )
-        print(f"     Found {len(specialty_pmids)} articles (total available: {specialty_count})")
-
-    # Search general journals with specialty filter
-    if general_query:
-        print("  🌐 General journals (specialty-filtered)...")
-        general_pmids, general_count = esearch_pmids(
-            query=general_query,
-            days=args.days,
-            max_results=args.max,
-            api_key=api_key,
-            email=email,
-        )
-        print(f"     Found {len(general_pmids)} articles (total available: {general_count})")
+    if args.max > ESEARCH_MAX_RECORDS:
+        print(f"⚠️  PubMed esearch returns at most {ESEARCH_MAX_RECORDS:,} records per query; "
+              f"capping --max {args.max} to {ESEARCH_MAX_RECORDS:,}", file=sys.stderr)
+        args.max = ESEARCH_MAX_RECORDS
+
+    # One limiter paces every E-utilities call this run (both searches and all efetch batches)
+    limiter = RateLimiter(NCBI_MAX_RPS_WITH_KEY if api_key else NCBI_MAX_RPS)
+
+    # The two searches are independent, so run them concurrently
+    search_kwargs = dict(
+        days=args.days, max_results=args.max, api_key=api_key, email=email, limiter=limiter, today=run_dt.date()
+    )
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        specialty_future = pool.submit(esearch_pmids, specialty_query, **search_kwargs) if specialty_query else None
+        general_future = pool.submit(esearch_pmids, general_query, **search_kwargs) if general_query else None
+
+        # Search specialty journals
+        if specialty_future:
+            print("  📚 Specialty journals...")
+            specialty_pmids, specialty_count = specialty_future.result()
+            print(f"     Found {len(specialty_pmids)} articles (total available: {specialty_count})")
+
+        # Search general journals with specialty filter
+        if general_future:
+            print("  🌐 General journals (specialty-filtered)...")
+            general_pmids, general_count = general_future.result()
+            print(f"     Found {len(general_pmids)} articles (total available: {general_count})")
 
     # Merge PMIDs (avoid duplicates)
     all_pmids_set = set(specialty_pmids) | set(general_pmids)
-    pmids = list(all_pmids_set)
     count = specialty_count + general_count
 
-    if not pmids:
+    if not all_pmids_set:
         print("No PMIDs found.")
         return 0
 
-    print(f"✓ Total: {len(pmids)} unique articles")
+    print(f"✓ Total: {len(all_pmids_set)} unique articles")
+
+    # Dedupe across runs before efetch, so previously-seen articles are never fetched or parsed
+    state_path = Path(state_file)
+    skip_state = args.test_mode or args.no_dedupe
+    seen_pmids = load_seen_pmids(state_path) if not skip_state else set()
+    pmids = list(all_pmids_set - seen_pmids)
+    skipped_seen = len(all_pmids_set) - len(pmids)
+    if skipped_seen:
+        print(f"⏭️  Skipping {skipped_seen} previously-seen articles")
+
     print("📥 Fetching article details...")
-    articles = efetch_details(pmids, api_key=api_key, email=email)
+    cache_dir = Path(args.cache_dir) if args.cache_dir else None
+    articles = efetch_details(pmids, api_key=api_key, email=email, cache_dir=cache_dir, limiter=limiter)
 
     # Filter and categorize
     categorized = filter_and_categorize(articles, args.include_no_abstract)
@@ -520,22 +987,22 @@ def main() -> int:
     # Prepare digest (priority + standard)
     digest_articles = categorized["priority"] + categorized["standard"]
 
-    # Dedupe across runs
-    state_path = Path(state_file)
-    skip_state = args.test_mode or args.no_dedupe
-    seen_pmids = load_seen_pmids(state_path) if not skip_state else set()
+    # efetch can return a record under a different PMID than requested, so check the digest again
     deduped_digest, removed_dupes = dedupe_articles_by_pmid(digest_articles, seen_pmids)
+    removed_dupes += skipped_seen
 
     # Update state with new PMIDs actually included (skip in test mode)
     if not skip_state:
-        for a in deduped_digest:
-            pmid = (a.get("pmid") or "").strip()
-            if pmid:
-                seen_pmids.add(pmid)
-        save_seen_pmids(state_path, seen_pmids)
+        new_pmids = {a.pmid for a in deduped_digest if a.pmid} - seen_pmids
+        # Nothing new: leave the committed state file (and its updated_at) untouched
+        if new_pmids:
+            seen_pmids |= new_pmids
+            save_seen_pmids(state_path, seen_pmids)
 
     # Print statistics
-    print(f"\n📊 Article Classification (pre-dedupe):")
+    # Seen PMIDs were dropped before efetch, so these counts cover new articles only
+    print(f"\n📊 Article Classification (new articles):")
+    print(f"  Previously seen (not fetched): {skipped_seen}")
     print(f"  Priority Research: {len(categorized['priority'])}")
     print(f"  Standard Articles: {len(categorized['standard'])}")
     print(f"  Needs Review: {len(categorized['needs_review'])}")
@@ -549,14 +1016,13 @@ def main() -> int:
         print(f"\n🧹 Dedupe: removed {removed_dupes} previously-seen articles")
         print(f"  State file: {state_path} (total seen: {len(seen_pmids)})")
 
-    run_dt = datetime.now(timezone.utc)
     run_date = run_dt.date().isoformat()
     run_ts = run_dt.strftime("%Y-%m-%dT%H%M%SZ")
 
     dated_output_path = make_dated_output_path(output_path, run_ts)
 
     payload = {
-        "generated_at": datetime.now(timezone.utc).isoformat(),
+        "generated_at": run_dt.isoformat(),
         "run_date": run_date,
         "days": args.days,
         "journals": {
@@ -564,7 +1030,8 @@ def main() -> int:
             "general_filtered": config["general_journals"],
         },
         "total_fetched": len(articles),
-        "digest_count_pre_dedupe": len(digest_articles),
+        # Previously-seen PMIDs skipped before efetch were all digest articles in earlier runs
+        "digest_count_pre_dedupe": len(digest_articles) + skipped_seen,
         "digest_count": len(deduped_digest),
         "dedupe": {
             "enabled": (not args.no_dedupe),
@@ -572,6 +1039,8 @@ def main() -> int:
             "previously_seen_removed": removed_dupes,
         },
         "statistics": {
+            # Category counts cover new articles; previously-seen ones were skipped before efetch
+            "skipped_seen": skipped_seen,
             "priority": len(categorized["priority"]),
             "standard": len(categorized["standard"]),
             "needs_review": len(categorized["needs_review"]),
@@ -581,13 +1050,25 @@ def main() -> int:
         "excluded_articles": categorized["excluded"] if args.include_no_abstract else [],
     }
 
+    # Serialise once; both files get identical bytes
+    payload_bytes = dump_json_bytes(payload, pretty=args.pretty)
+
     # Write date-stamped archive
-    with open(dated_output_path, "w", encoding="utf-8") as f:
-        json.dump(payload, f, ensure_ascii=False, indent=2)
+    if args.compress and not ZSTD_AVAILABLE:
+        print("⚠️  zstandard not installed; writing uncompressed archive. Install with: pip install zstandard",
+              file=sys.stderr)
+    if args.compress and ZSTD_AVAILABLE:
+        dated_output_path = dated_output_path.with_name(dated_output_path.name + ".zst")
+        write_zstd(dated_output_path, payload_bytes)
+    else:
+        write_bytes_atomic(dated_output_path, payload_bytes)
 
-    # Write stable "latest" output (same content, overwritten each run)
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(payload, f, ensure_ascii=False, indent=2)
+    # Write stable "latest" output (same content, overwritten each run; always plain JSON for the email step).
+    # When the archive holds the same plain bytes, link to it instead of writing them twice.
+    if dated_output_path.suffix == output_path.suffix:
+        link_or_write_atomic(dated_output_path, output_path, payload_bytes)
+    else:
+        write_bytes_atomic(output_path, payload_bytes)
 
     print(f"\n✅ Saved {len(deduped_digest)} new digestible articles")
     print(f"   Archive: {dated_output_path}")
@@ -597,9 +1078,9 @@ def main() -> int:
     if categorized["priority"]:
         print(f"\n🌟 Sample Priority Research:")
         for article in categorized["priority"][:3]:
-            print(f"  • {article['title'][:80]}...")
-            pts = ", ".join(article.get("publication_types", []))
-            print(f"    {article['journal']} | {pts}")
+            print(f"  • {article.title[:80]}...")
+            pts = ", ".join(article.publication_types)
+            print(f"    {article.journal} | {pts}")
 
     return 0
 
@@ -16,6 +16,8 @@ Usage (local):
 Notes:
 - Assumes fetch_cardiology_pubmed.py and summarise_and_email.py are in the same repo root.
 - Passes through optional flags for fetch; summarise/email reads env vars and latest JSON.
+- Both steps run in this process by calling each script's main(argv); pass --isolated
+  to run them as separate Python subprocesses instead.
 """
 
 from __future__ import annotations
@@ -24,7 +26,9 @@ import argparse
 import os
 import subprocess
 import sys
+import traceback
 from pathlib import Path
+from typing import Callable, List, Optional
 
 try:
     from dotenv import load_dotenv
@@ -38,12 +42,28 @@ def run_cmd(cmd: list[str]) -> None:
     subprocess.run(cmd, check=True)
 
 
+def run_step(script: Path, entry: Callable[[Optional[List[str]]], int], argv: list[str]) -> None:
+    """Call a script's main(argv) in-process, raising like run_cmd if it fails."""
+    print("\n▶ " + " ".join([script.name] + argv))
+    try:
+        rc = entry(argv)
+    except SystemExit as e:
+        # argparse reports bad arguments by exiting
+        rc = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+    except Exception as e:
+        # Report a crash the way a failed subprocess would (traceback + exit 1)
+        traceback.print_exc()
+        raise subprocess.CalledProcessError(1, [str(script)] + argv) from e
+    if rc:
+        raise subprocess.CalledProcessError(rc, [str(script)] + argv)
+
+
 def main() -> int:
     ap = argparse.ArgumentParser(description="Run fetch + summarise/email pipeline")
     ap.add_argument("--specialty", type=str, default="cardiology",
                     help="Specialty to run (default: cardiology). Loads config from specialties/{specialty}.json")
     ap.add_argument("--days", type=int, default=7, help="Look back this many days (default: 7)")
-    ap.add_argument("--max", type=int, default=300, help="Max PMIDs to retrieve (default: 300)")
+    ap.add_argument("--max", type=int, default=300, help="Max PMIDs to retrieve per search, up to 10000 (default: 300)")
     ap.add_argument("--email", type=str, default=os.getenv("NCBI_EMAIL"), help="NCBI contact email (or set NCBI_EMAIL)")
     ap.add_argument("--api-key", type=str, default=os.getenv("NCBI_API_KEY"), help="NCBI API key (or set NCBI_API_KEY)")
     ap.add_argument("--out", type=str, default=None,
@@ -53,8 +73,14 @@ def main() -> int:
     ap.add_argument("--dry-run-email", action="store_true", help="Do not send email; generate HTML preview only")
     ap.add_argument("--send-delay", type=float, default=1.5,
                     help="Delay (seconds) between per-recipient sends; passed to summarise step")
+    ap.add_argument("--send-burst", type=int, default=20,
+                    help="Sends allowed back-to-back before --send-delay pacing applies; passed to summarise step")
     ap.add_argument("--test-mode", action="store_true",
                     help="Test mode: skip all state file reading/writing in both fetch and email steps")
+    ap.add_argument("--use-batch-api", action="store_true",
+                    help="Summarise via the OpenAI Batch API; passed to summarise step")
+    ap.add_argument("--isolated", action="store_true",
+                    help="Run each step in its own Python subprocess instead of in-process")
     args = ap.parse_args()
 
     # Set default output path based on specialty (backward compatible with cardiology)
@@ -84,27 +110,37 @@ def main() -> int:
 
     try:
         # 1) Fetch step
-        fetch_cmd = [sys.executable, str(fetch_script), "--specialty", args.specialty, "--days", str(args.days), "--max", str(args.max), "--out", output_path, "--email", args.email]
+        fetch_args = ["--specialty", args.specialty, "--days", str(args.days), "--max", str(args.max), "--out", output_path, "--email", args.email]
         if args.api_key:
-            fetch_cmd += ["--api-key", args.api_key]
+            fetch_args += ["--api-key", args.api_key]
         if args.include_no_abstract:
-            fetch_cmd += ["--include-no-abstract"]
+            fetch_args += ["--include-no-abstract"]
         if args.no_dedupe:
-            fetch_cmd += ["--no-dedupe"]
+            fetch_args += ["--no-dedupe"]
         if args.test_mode:
-            fetch_cmd += ["--test-mode"]
-
-        run_cmd(fetch_cmd)
+            fetch_args += ["--test-mode"]
 
         # 2) Summarise + email step
-        email_cmd = [sys.executable, str(email_script), "--specialty", args.specialty]
+        email_args = ["--specialty", args.specialty]
         if args.dry_run_email:
-            email_cmd += ["--dry-run"]
-        email_cmd += ["--send-delay", str(args.send_delay)]
+            email_args += ["--dry-run"]
+        email_args += ["--send-delay", str(args.send_delay), "--send-burst", str(args.send_burst)]
+        if args.use_batch_api:
+            email_args += ["--use-batch-api"]
         if args.test_mode:
-            email_cmd += ["--test-mode"]
-
-        run_cmd(email_cmd)
+            email_args += ["--test-mode"]
+
+        if args.isolated:
+            run_cmd([sys.executable, str(fetch_script)] + fetch_args)
+            run_cmd([sys.executable, str(email_script)] + email_args)
+        else:
+            # Same process: skips a second interpreter start-up and module import per step
+            sys.path.insert(0, str(repo_root))
+            import fetch_cardiology_pubmed
+            run_step(fetch_script, fetch_cardiology_pubmed.main, fetch_args)
+
+            import summarise_and_email
+            run_step(email_script, summarise_and_email.main, email_args)
 
         print("\n✅ Pipeline completed successfully.")
         return 0
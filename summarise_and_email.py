@@ -13,6 +13,7 @@ Summarise latest cardiology digest JSON with OpenAI and email as HTML via Gmail
 from __future__ import annotations
 
 import argparse
+import hashlib
 import json
 import os
 import re
@@ -20,12 +21,14 @@ import sys
 import ssl
 import smtplib
 import time
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache
 from datetime import datetime, timezone
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, cast
+from typing import Any, Dict, List, Optional, Set, Tuple, cast
 
 try:
     from dotenv import load_dotenv
@@ -33,7 +36,13 @@ try:
 except ImportError:
     pass
 
-import json
+# orjson parses and serialises JSON natively (optional, falls back to the stdlib json module)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+    ORJSON_AVAILABLE = False
 
 # Google Sheets integration (optional)
 try:
@@ -45,6 +54,14 @@ except ImportError:
     Credentials = None  # type: ignore[assignment]
     GSPREAD_AVAILABLE = False
 
+# tiktoken counts tokens exactly for abstract truncation (optional, falls back to a character budget)
+try:
+    import tiktoken
+    TIKTOKEN_AVAILABLE = True
+except ImportError:
+    tiktoken = None  # type: ignore[assignment]
+    TIKTOKEN_AVAILABLE = False
+
 from openai import OpenAI
 
 
@@ -52,8 +69,8 @@ from openai import OpenAI
 # Config + small helper utils
 # ----------------------------
 def read_json(path: Path) -> Dict[str, Any]:
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    raw = path.read_bytes()
+    return orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
 
 
 def load_specialty_config(specialty: str) -> Dict[str, Any]:
@@ -61,14 +78,26 @@ def load_specialty_config(specialty: str) -> Dict[str, Any]:
     config_path = Path(__file__).parent / "specialties" / f"{specialty}.json"
     if not config_path.exists():
         raise FileNotFoundError(f"Specialty config not found: {config_path}")
-    with open(config_path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    return read_json(config_path)
+
+
+def write_bytes_atomic(path: Path, data: bytes) -> None:
+    """Write and fsync a sibling temp file, then swap it into place so a crash never leaves a partial file."""
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
 
 
 def write_json(path: Path, payload: Dict[str, Any]) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(payload, f, ensure_ascii=False, indent=2)
+    if ORJSON_AVAILABLE:
+        data = orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    else:
+        data = json.dumps(payload, ensure_ascii=False, indent=2).encode("utf-8")
+    write_bytes_atomic(path, data)
 
 
 def load_sent_pmids(state_path: Path) -> set[str]:
@@ -92,6 +121,42 @@ def save_sent_pmids(state_path: Path, sent_pmids: set[str]) -> None:
     write_json(state_path, payload)
 
 
+def summary_cache_key(body: Dict[str, Any]) -> str:
+    """Hash of the full OpenAI request body, so a changed abstract, model or prompt is a cache miss."""
+    return hashlib.sha256(json.dumps(body, sort_keys=True, ensure_ascii=False).encode("utf-8")).hexdigest()
+
+
+def load_summary_cache(cache_path: Path) -> Dict[str, Dict[str, Any]]:
+    """Load cached summaries: {key: {"pmid", "cached_at", "summary"}}."""
+    if not cache_path.exists():
+        return {}
+    try:
+        entries = read_json(cache_path).get("summaries", {})
+        return entries if isinstance(entries, dict) else {}
+    except Exception:
+        return {}
+
+
+# Bounds the cache file each run loads and uploads to the Actions cache (it is never committed)
+SUMMARY_CACHE_MAX_ENTRIES = 10_000
+
+
+def save_summary_cache(
+    cache_path: Path,
+    cache: Dict[str, Dict[str, Any]],
+    max_entries: int = SUMMARY_CACHE_MAX_ENTRIES,
+) -> None:
+    """Write the cache, keeping only the max_entries most recently cached or reused summaries."""
+    if len(cache) > max_entries:
+        newest = sorted(cache.items(), key=lambda kv: str(kv[1].get("cached_at", "")), reverse=True)
+        cache = dict(newest[:max_entries])
+    payload = {
+        "updated_at": datetime.now(timezone.utc).isoformat(),
+        "summaries": cache,
+    }
+    write_json(cache_path, payload)
+
+
 def normalize_specialty(specialty: str) -> str:
     """Normalize specialty names to match command-line arguments."""
     specialty_lower = specialty.lower().strip()
@@ -106,6 +171,64 @@ def normalize_specialty(specialty: str) -> str:
     return mappings.get(specialty_lower, specialty_lower)
 
 
+GOOGLE_SCOPES = [
+    "https://www.googleapis.com/auth/spreadsheets.readonly",
+    "https://www.googleapis.com/auth/drive.readonly"
+]
+
+
+@lru_cache(maxsize=1)
+def _get_spreadsheet(sheet_id: str, creds_json: str) -> Any:
+    """Authorize gspread and open the spreadsheet once per run (failures are not cached)."""
+    creds = Credentials.from_service_account_info(json.loads(creds_json), scopes=GOOGLE_SCOPES)
+    return gspread.authorize(creds).open_by_key(sheet_id)
+
+
+def _batch_get_subscriber_ranges(
+    spreadsheet: Any, subscribers_sheet: str
+) -> Optional[Tuple[List[List[str]], List[str]]]:
+    """
+    Read subscribers B:D and unsubscribers C in a single values.batchGet request.
+
+    Returns (subscriber rows, unsubscriber emails), headers skipped, or None if the
+    request fails (e.g. a tab is missing) so the caller can read sheet by sheet.
+    """
+    try:
+        sheet_name = subscribers_sheet.replace("'", "''")  # A1 notation escapes quotes by doubling
+        response = spreadsheet.values_batch_get([f"'{sheet_name}'!B2:D", "'unsubscribers'!C2:C"])
+        value_ranges = response.get("valueRanges", [])
+        sub_rows = value_ranges[0].get("values", [])
+        unsub_values = [row[0] for row in value_ranges[1].get("values", []) if row]
+    except Exception:
+        return None
+    return sub_rows, unsub_values
+
+
+def _read_subscriber_sheets(spreadsheet: Any, subscribers_sheet: str) -> Tuple[List[List[str]], List[str]]:
+    """Per-worksheet fallback for _batch_get_subscriber_ranges, tolerating missing tabs."""
+    sub_rows: List[List[str]] = []
+    try:
+        sub_sheet = spreadsheet.worksheet(subscribers_sheet)
+        # Keep cols B:D (firstname, email, specialty), skip header
+        sub_rows = [row[1:4] for row in sub_sheet.get_all_values()[1:]]
+    except Exception as e:
+        if gspread and isinstance(e, gspread.exceptions.WorksheetNotFound):
+            print(f"⚠️ '{subscribers_sheet}' sheet not found")
+        else:
+            raise
+
+    unsub_values: List[str] = []
+    try:
+        unsub_sheet = spreadsheet.worksheet("unsubscribers")
+        unsub_values = unsub_sheet.col_values(3)[1:]  # Column C, skip header
+    except Exception as e:
+        if gspread and isinstance(e, gspread.exceptions.WorksheetNotFound):
+            print("⚠️ 'unsubscribers' sheet not found, proceeding without exclusions")
+        else:
+            raise
+    return sub_rows, unsub_values
+
+
 def fetch_subscribers_from_sheet(subscribers_sheet: str = "subscribers", specialty_filter: Optional[str] = None) -> List[Tuple[str, str]]:
     """
     Fetch subscriber emails and first names from Google Sheet, excluding unsubscribers.
@@ -129,55 +252,33 @@ def fetch_subscribers_from_sheet(subscribers_sheet: str = "subscribers", special
         return []
 
     try:
-        # Parse credentials from env var (JSON string)
-        creds_dict = json.loads(creds_json)
-        scopes = [
-            "https://www.googleapis.com/auth/spreadsheets.readonly",
-            "https://www.googleapis.com/auth/drive.readonly"
-        ]
-        creds = Credentials.from_service_account_info(creds_dict, scopes=scopes)
-        client = gspread.authorize(creds)
+        # Credentials come from env var (JSON string)
+        spreadsheet = _get_spreadsheet(sheet_id, creds_json)
 
-        spreadsheet = client.open_by_key(sheet_id)
+        # One values.batchGet for both tabs, narrowed to the columns used; per-sheet reads as fallback
+        ranges = _batch_get_subscriber_ranges(spreadsheet, subscribers_sheet)
+        if ranges is not None:
+            sub_rows, unsub_values = ranges
+        else:
+            sub_rows, unsub_values = _read_subscriber_sheets(spreadsheet, subscribers_sheet)
 
-        # Get subscribers from specified sheet (col B = firstname, col C = email, col D = specialty)
+        # Subscriber rows are [firstname (B), email (C), specialty (D)]
+        filter_normalized = normalize_specialty(specialty_filter) if specialty_filter else ""
         subscribers_dict: Dict[str, str] = {}  # email -> firstname
-        try:
-            sub_sheet = spreadsheet.worksheet(subscribers_sheet)
-            # Get all values to pair firstname (col B) with email (col C) and specialty (col D)
-            all_rows = sub_sheet.get_all_values()[1:]  # Skip header
-            for row in all_rows:
-                if len(row) >= 3:
-                    firstname = str(row[1]).strip() if row[1] else ""
-                    email = str(row[2]).strip().lower() if row[2] else ""
-                    specialty_raw = str(row[3]).strip() if len(row) >= 4 and row[3] else ""
-
-                    # Filter by specialty if specified (normalize both values for comparison)
-                    if specialty_filter:
-                        specialty_normalized = normalize_specialty(specialty_raw)
-                        filter_normalized = normalize_specialty(specialty_filter)
-                        if specialty_normalized != filter_normalized:
-                            continue
-
-                    if email and "@" in email:
-                        subscribers_dict[email] = firstname
-        except Exception as e:
-            if gspread and isinstance(e, gspread.exceptions.WorksheetNotFound):
-                print(f"⚠️ '{subscribers_sheet}' sheet not found")
-            else:
-                raise
+        for row in sub_rows:
+            if len(row) >= 2:
+                firstname = str(row[0]).strip() if row[0] else ""
+                email = str(row[1]).strip().lower() if row[1] else ""
+                specialty_raw = str(row[2]).strip() if len(row) >= 3 and row[2] else ""
 
-        # Get unsubscribers from "unsubscribers" sheet, col C (skip header)
-        unsubscribers: set = set()
-        try:
-            unsub_sheet = spreadsheet.worksheet("unsubscribers")
-            unsubscribers_raw = unsub_sheet.col_values(3)[1:]  # Column C, skip header
-            unsubscribers = {str(e).strip().lower() for e in unsubscribers_raw if e and "@" in str(e)}
-        except Exception as e:
-            if gspread and isinstance(e, gspread.exceptions.WorksheetNotFound):
-                print("⚠️ 'unsubscribers' sheet not found, proceeding without exclusions")
-            else:
-                raise
+                # Filter by specialty if specified (normalize both values for comparison)
+                if specialty_filter and normalize_specialty(specialty_raw) != filter_normalized:
+                    continue
+
+                if email and "@" in email:
+                    subscribers_dict[email] = firstname
+
+        unsubscribers = {str(e).strip().lower() for e in unsub_values if e and "@" in str(e)}
 
         # Active subscribers = subscribers minus unsubscribers
         active = [(email, firstname) for email, firstname in subscribers_dict.items() if email not in unsubscribers]
@@ -190,8 +291,11 @@ def fetch_subscribers_from_sheet(subscribers_sheet: str = "subscribers", special
         return []
 
 
+_CTRL_RE = re.compile(r"[\x00-\x08\x0B\x0C\x0E-\x1F]")
+
+
 def strip_control_chars(s: str) -> str:
-    return re.sub(r"[\x00-\x08\x0B\x0C\x0E-\x1F]", "", s)
+    return _CTRL_RE.sub("", s)
 
 
 @dataclass
@@ -202,61 +306,62 @@ class SavedArticle:
     timestamp: str
 
 
-def fetch_user_saves(user_email: str) -> List[SavedArticle]:
+def fetch_all_user_saves() -> Dict[str, List[SavedArticle]]:
     """
-    Fetch articles the user has saved (voted 'yes' on) from the feedback sheet.
+    Fetch every user's saved articles (voted 'yes') from the feedback sheet in one read.
 
-    Returns list of SavedArticle for display in 'Your Saves' section.
+    Returns {lowercased email: up to 5 SavedArticle, most recent first}.
     """
     if not GSPREAD_AVAILABLE or gspread is None or Credentials is None:
-        return []
+        return {}
 
     sheet_id = os.getenv("GOOGLE_SHEET_ID", "")
     creds_json = os.getenv("GOOGLE_CREDENTIALS", "")
 
     if not sheet_id or not creds_json:
-        return []
+        return {}
 
     try:
-        creds_dict = json.loads(creds_json)
-        scopes = [
-            "https://www.googleapis.com/auth/spreadsheets.readonly",
-            "https://www.googleapis.com/auth/drive.readonly"
-        ]
-        creds = Credentials.from_service_account_info(creds_dict, scopes=scopes)
-        client = gspread.authorize(creds)
-        spreadsheet = client.open_by_key(sheet_id)
+        spreadsheet = _get_spreadsheet(sheet_id, creds_json)
 
         try:
             feedback_sheet = spreadsheet.worksheet("feedback")
         except Exception:
             # No feedback sheet yet
-            return []
+            return {}
 
         # Get all feedback data: timestamp, user, pmid, title, vote
         all_rows = feedback_sheet.get_all_values()[1:]  # Skip header
 
-        saves = []
-        user_email_lower = user_email.lower().strip()
-
+        saves_by_email: Dict[str, List[SavedArticle]] = {}
         for row in all_rows:
             if len(row) >= 5:
-                timestamp = str(row[0]).strip()
-                email = str(row[1]).strip().lower()
-                pmid = str(row[2]).strip()
-                title = str(row[3]).strip()
                 vote = str(row[4]).strip().lower()
+                if vote != "yes":
+                    continue
+                email = str(row[1]).strip().lower()
+                saves_by_email.setdefault(email, []).append(SavedArticle(
+                    pmid=str(row[2]).strip(),
+                    title=str(row[3]).strip(),
+                    timestamp=str(row[0]).strip(),
+                ))
 
-                if email == user_email_lower and vote == "yes":
-                    saves.append(SavedArticle(pmid=pmid, title=title, timestamp=timestamp))
-
-        # Return most recent first, limit to 5
-        saves.reverse()
-        return saves[:5]
+        # Most recent first, limit to 5 per user
+        return {email: saves[::-1][:5] for email, saves in saves_by_email.items()}
 
     except Exception as e:
         print(f"⚠️ Failed to fetch user saves: {e}")
-        return []
+        return {}
+
+
+def fetch_user_saves(user_email: str) -> List[SavedArticle]:
+    """
+    Fetch articles the user has saved (voted 'yes' on) from the feedback sheet.
+
+    Returns list of SavedArticle for display in 'Your Saves' section.
+    For many users, call fetch_all_user_saves() once instead.
+    """
+    return fetch_all_user_saves().get(user_email.lower().strip(), [])
 
 
 def html_escape(s: str) -> str:
@@ -280,13 +385,26 @@ class Article:
     publication_types: List[str]
     category: str
     authors: List[str]
+    # Study-type flags, classified once in parse_articles
+    is_rct: bool = field(default=False)
+    is_priority: bool = field(default=False)
+    # Escaped HTML for the title, link and "journal · date · authors" line, shared by every render
+    title_html: str = field(init=False, default="", repr=False)
+    url_html: str = field(init=False, default="", repr=False)
+    meta_html: str = field(init=False, default="", repr=False)
+
+    def __post_init__(self) -> None:
+        self.title_html = html_escape(strip_control_chars(self.title))
+        self.url_html = html_escape(self.url)
+        authors = ", ".join(self.authors)
+        self.meta_html = " · ".join(html_escape(p) for p in (self.journal, self.pub_date, authors) if p)
 
 
 def parse_articles(latest_payload: Dict[str, Any]) -> List[Article]:
     items = latest_payload.get("articles", [])
     out: List[Article] = []
     for a in items:
-        out.append(Article(
+        art = Article(
             pmid=str(a.get("pmid", "")).strip(),
             title=str(a.get("title", "")).strip(),
             journal=str(a.get("journal", "")).strip(),
@@ -296,7 +414,9 @@ def parse_articles(latest_payload: Dict[str, Any]) -> List[Article]:
             publication_types=list(a.get("publication_types", []) or []),
             category=str(a.get("category", "")).strip(),
             authors=list(a.get("authors", []) or []),
-        ))
+        )
+        art.is_rct, art.is_priority = classify_study(art)
+        out.append(art)
     return out
 
 
@@ -319,37 +439,45 @@ RCT_TERMS = {
     "randomised controlled trial",
 }
 
+RCT_PHRASES = ("randomized controlled", "randomised controlled", "randomly assigned", "random assignment")
 
-def is_rct(a: Article) -> bool:
-    """Check if article is specifically a randomised controlled trial."""
-    pub_types_lower = {pt.lower().strip() for pt in a.publication_types}
+PRIORITY_PHRASES = (
+    "randomized", "randomised", "meta-analysis", "meta analysis",
+    "systematic review", "cohort study", "multicenter", "multicentre",
+    "registry", "nationwide", "population-based",
+)
+
+
+def classify_study(a: Article) -> Tuple[bool, bool]:
+    """
+    Return (is_rct, is_priority) for an article.
 
-    # Check publication types for RCT
-    if pub_types_lower & RCT_TERMS:
-        return True
+    Publication types are checked first; title + abstract are lowercased at most
+    once and shared by both phrase checks.
+    """
+    pub_types_lower = {pt.lower().strip() for pt in a.publication_types}
+    rct = bool(pub_types_lower & RCT_TERMS)
+    priority = bool(pub_types_lower & PRIORITY_STUDY_TYPES)
+    if rct and priority:
+        return True, True
 
-    # Fallback: check title/abstract for RCT indicators
+    # Fallback: check title/abstract for study type indicators
     text_lower = (a.title + " " + a.abstract).lower()
-    rct_phrases = ["randomized controlled", "randomised controlled", "randomly assigned", "random assignment"]
-    return any(phrase in text_lower for phrase in rct_phrases)
+    if not rct:
+        rct = any(phrase in text_lower for phrase in RCT_PHRASES)
+    if not priority:
+        priority = any(phrase in text_lower for phrase in PRIORITY_PHRASES)
+    return rct, priority
 
 
-def is_priority_study(a: Article) -> bool:
-    """Check if article is a high-priority study type (RCT, meta-analysis, systematic review, large cohort)."""
-    pub_types_lower = {pt.lower().strip() for pt in a.publication_types}
+def is_rct(a: Article) -> bool:
+    """Check if article is specifically a randomised controlled trial."""
+    return classify_study(a)[0]
 
-    # Check publication types
-    if pub_types_lower & PRIORITY_STUDY_TYPES:
-        return True
 
-    # Fallback: check title/abstract for priority study indicators
-    text_lower = (a.title + " " + a.abstract).lower()
-    priority_phrases = [
-        "randomized", "randomised", "meta-analysis", "meta analysis",
-        "systematic review", "cohort study", "multicenter", "multicentre",
-        "registry", "nationwide", "population-based"
-    ]
-    return any(phrase in text_lower for phrase in priority_phrases)
+def is_priority_study(a: Article) -> bool:
+    """Check if article is a high-priority study type (RCT, meta-analysis, systematic review, large cohort)."""
+    return classify_study(a)[1]
 
 
 def select_for_summary(
@@ -365,21 +493,26 @@ def select_for_summary(
     2. Other priority category articles with abstracts
     3. Standard articles with abstracts
     """
-    priority_studies = [a for a in articles if is_priority_study(a)]
-    non_priority_studies = [a for a in articles if not is_priority_study(a)]
-
-    other_priority = [a for a in non_priority_studies if a.category == "priority"]
-    standard = [a for a in non_priority_studies if a.category == "standard"]
-
-    # Order: priority studies first, then other priority, then standard
-    ordered = priority_studies + other_priority + standard
-
-    # Filter for summarisation eligibility (must have abstract)
-    eligible = [a for a in ordered if len(a.abstract) >= min_abstract_chars]
-    to_sum = eligible[:max_summaries]
-
-    to_sum_pmids = {a.pmid for a in to_sum}
-    headlines = [a for a in ordered if a.pmid not in to_sum_pmids]
+    priority_studies: List[Article] = []
+    other_priority: List[Article] = []
+    standard: List[Article] = []
+    for a in articles:
+        if a.is_priority:
+            priority_studies.append(a)
+        elif a.category == "priority":
+            other_priority.append(a)
+        elif a.category == "standard":
+            standard.append(a)
+
+    # Order: priority studies first, then other priority, then standard.
+    # The first max_summaries with an abstract are summarised; the rest become headlines.
+    to_sum: List[Article] = []
+    headlines: List[Article] = []
+    for a in priority_studies + other_priority + standard:
+        if len(to_sum) < max_summaries and len(a.abstract) >= min_abstract_chars:
+            to_sum.append(a)
+        else:
+            headlines.append(a)
 
     return to_sum, headlines
 
@@ -423,10 +556,40 @@ def normalize_study_type(study_type: str) -> str:
     return " ".join(result)
 
 
-def summarise_one(client: OpenAI, model: str, a: Article, specialty_name: str = "cardiology") -> Dict[str, Any]:
-    """
-    Uses OpenAI Chat Completions API with strict JSON schema output.
-    """
+MAX_ABSTRACT_TOKENS = 1500
+CHARS_PER_TOKEN = 4  # rough average for English text, used without tiktoken
+
+
+@lru_cache(maxsize=None)
+def _token_encoding(model: str) -> Any:
+    """tiktoken encoding for model, or None if tiktoken or its encoding files are unavailable."""
+    if not TIKTOKEN_AVAILABLE:
+        return None
+    try:
+        name = tiktoken.encoding_name_for_model(model)
+    except KeyError:
+        name = "o200k_base"
+    try:
+        return tiktoken.get_encoding(name)
+    except Exception:
+        # Encoding files are downloaded on first use; offline runs use the character budget
+        return None
+
+
+def truncate_abstract(abstract: str, model: str, max_tokens: int = MAX_ABSTRACT_TOKENS) -> str:
+    """Cap an abstract at max_tokens input tokens; most abstracts are well under and pass through unchanged."""
+    enc = _token_encoding(model)
+    if enc is None:
+        max_chars = max_tokens * CHARS_PER_TOKEN
+        return abstract if len(abstract) <= max_chars else abstract[:max_chars] + " [truncated]"
+    tokens = enc.encode(abstract)
+    if len(tokens) <= max_tokens:
+        return abstract
+    return enc.decode(tokens[:max_tokens]) + " [truncated]"
+
+
+def summary_request_body(model: str, a: Article, specialty_name: str = "cardiology") -> Dict[str, Any]:
+    """Chat Completions request body for one article (shared by direct and Batch API calls)."""
     system = (
         f"You are writing a brief editorial note for a {specialty_name.lower()} digest. "
         "Return JSON with exactly five fields:\n"
@@ -457,22 +620,29 @@ JOURNAL: {a.journal}
 PUB DATE: {a.pub_date}
 PUBLICATION TYPES: {", ".join(a.publication_types) if a.publication_types else "Not specified"}
 ABSTRACT:
-{a.abstract}
+{truncate_abstract(a.abstract, model)}
 """
 
-    response_format = cast(Any, {
-        "type": "json_schema",
-        "json_schema": SUMMARY_SCHEMA,
-    })
-    completion = client.chat.completions.create(
-        model=model,
-        messages=[
+    return {
+        "model": model,
+        "messages": [
             {"role": "system", "content": system},
             {"role": "user", "content": user},
         ],
-        response_format=response_format,
-        temperature=0.2,
-    )
+        "response_format": {
+            "type": "json_schema",
+            "json_schema": SUMMARY_SCHEMA,
+        },
+        "temperature": 0.2,
+    }
+
+
+def summarise_one(client: OpenAI, model: str, a: Article, specialty_name: str = "cardiology") -> Dict[str, Any]:
+    """
+    Uses OpenAI Chat Completions API with strict JSON schema output.
+    """
+    body = summary_request_body(model, a, specialty_name)
+    completion = client.chat.completions.create(**cast(Any, body))
 
     content = completion.choices[0].message.content
     if not content:
@@ -481,26 +651,139 @@ ABSTRACT:
     return json.loads(content)
 
 
+def summarise_all(
+    client: OpenAI,
+    model: str,
+    articles: List[Article],
+    specialty_name: str = "cardiology",
+    max_workers: int = 8,
+) -> List[Tuple[Article, Dict[str, Any]]]:
+    """
+    Summarise articles concurrently, since each call is a network round trip.
+
+    Results keep the input order; failed articles are reported and skipped.
+    """
+    if not articles:
+        return []
+
+    summaries: List[Tuple[Article, Dict[str, Any]]] = []
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(articles)))) as pool:
+        futures = []
+        for a in articles:
+            print(f"  Summarising: {a.pmid} — {a.title[:60]}...")
+            futures.append(pool.submit(summarise_one, client, model, a, specialty_name))
+        for a, future in zip(articles, futures):
+            try:
+                summaries.append((a, future.result()))
+            except Exception as e:
+                print(f"⚠️ Summary failed for PMID {a.pmid}: {e}", file=sys.stderr)
+    return summaries
+
+
+BATCH_POLL_MAX_INTERVAL = 60.0
+BATCH_FINAL_STATUSES = {"completed", "failed", "expired", "cancelled"}
+
+
+def summarise_batch(
+    client: OpenAI,
+    model: str,
+    articles: List[Article],
+    specialty_name: str = "cardiology",
+    timeout_s: float = 3600.0,
+) -> List[Tuple[Article, Dict[str, Any]]]:
+    """
+    Summarise articles through the OpenAI Batch API (half the token price, separate rate limits).
+
+    Polls with exponential backoff until the batch finishes. Raises TimeoutError
+    (after cancelling) or RuntimeError if no results come back, so the caller can
+    fall back to direct requests. Results keep the input order.
+    """
+    if not articles:
+        return []
+
+    lines = [
+        json.dumps({
+            "custom_id": a.pmid,
+            "method": "POST",
+            "url": "/v1/chat/completions",
+            "body": summary_request_body(model, a, specialty_name),
+        }, ensure_ascii=False)
+        for a in articles
+    ]
+    batch_file = client.files.create(file=("summaries.jsonl", "\n".join(lines).encode("utf-8")), purpose="batch")
+    batch = client.batches.create(
+        input_file_id=batch_file.id, endpoint="/v1/chat/completions", completion_window="24h"
+    )
+    print(f"  📦 Submitted batch {batch.id} with {len(articles)} summary requests")
+
+    deadline = time.monotonic() + timeout_s
+    delay = 5.0
+    while batch.status not in BATCH_FINAL_STATUSES:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            client.batches.cancel(batch.id)
+            raise TimeoutError(f"batch {batch.id} still {batch.status} after {timeout_s:.0f}s")
+        time.sleep(min(delay, remaining))
+        delay = min(delay * 2, BATCH_POLL_MAX_INTERVAL)
+        batch = client.batches.retrieve(batch.id)
+
+    if batch.status != "completed" or not batch.output_file_id:
+        raise RuntimeError(f"batch {batch.id} ended with status {batch.status}")
+
+    by_pmid: Dict[str, Dict[str, Any]] = {}
+    failed: Set[str] = set()
+    for line in client.files.content(batch.output_file_id).text.splitlines():
+        if not line.strip():
+            continue
+        record = json.loads(line)
+        pmid = record.get("custom_id", "")
+        response = record.get("response") or {}
+        try:
+            if response.get("status_code") != 200:
+                raise ValueError(record.get("error") or f"HTTP {response.get('status_code')}")
+            content = response["body"]["choices"][0]["message"]["content"]
+            if not content:
+                raise ValueError("Empty response from OpenAI")
+            by_pmid[pmid] = json.loads(content)
+        except Exception as e:
+            failed.add(pmid)
+            print(f"⚠️ Summary failed for PMID {pmid}: {e}", file=sys.stderr)
+
+    summaries: List[Tuple[Article, Dict[str, Any]]] = []
+    for a in articles:
+        if a.pmid in by_pmid:
+            summaries.append((a, by_pmid[a.pmid]))
+        elif a.pmid not in failed:
+            print(f"⚠️ Summary missing from batch output for PMID {a.pmid}", file=sys.stderr)
+    return summaries
+
+
 # ----------------------------
 # HTML rendering
 # ----------------------------
+# Static fragments shared by every card
+RCT_BADGE_LARGE = (
+    '<span style="display:inline-block; padding:3px 10px; '
+    'background:#e8f5e9; color:#2e7d32; font-size:10px; '
+    'font-weight:600; border-radius:4px; margin-left:10px; '
+    'vertical-align:middle;">RCT</span>'
+)
+RCT_BADGE_SMALL = (
+    '<span style="display:inline-block; padding:2px 6px; '
+    'background:#e8f5e9; color:#2e7d32; font-size:9px; '
+    'font-weight:600; border-radius:3px; margin-left:6px;">RCT</span>'
+)
+TAG_PILL_OPEN = (
+    '<span style="display:inline-block; padding:3px 8px; margin:2px 6px 2px 0; '
+    'border:1px solid #ddd; border-radius:12px; font-size:11px; color:#555;">'
+)
+
+
 def hero_card_html(a: Article, s: Dict[str, Any], feedback_html: str = "") -> str:
     """Minimal three-field card with RCT badge only for actual RCTs."""
-    title = html_escape(strip_control_chars(a.title))
-    journal = html_escape(a.journal)
-    pub_date = html_escape(a.pub_date)
-    url = html_escape(a.url)
-    authors = html_escape(", ".join(a.authors)) if a.authors else ""
 
     # Badge only for actual RCTs (not all priority studies)
-    rct_badge = ""
-    if is_rct(a):
-        rct_badge = (
-            '<span style="display:inline-block; padding:3px 10px; '
-            'background:#e8f5e9; color:#2e7d32; font-size:10px; '
-            'font-weight:600; border-radius:4px; margin-left:10px; '
-            'vertical-align:middle;">RCT</span>'
-        )
+    rct_badge = RCT_BADGE_LARGE if a.is_rct else ""
 
     # Normalize study type to consistent formatting
     raw_study_type = s.get("study_type", "")
@@ -510,17 +793,11 @@ def hero_card_html(a: Article, s: Dict[str, Any], feedback_html: str = "") -> st
     so_what = html_escape(strip_control_chars(s.get("so_what", "")))
     tags = s.get("tags", [])
 
-    # Build meta line: journal · date · authors
-    meta_parts = [p for p in [journal, pub_date, authors] if p]
-    meta_line = " · ".join(meta_parts)
-
     # Build tags HTML
     tags_html = ""
     if tags:
         tags_pills = "".join(
-            f'<span style="display:inline-block; padding:3px 8px; margin:2px 6px 2px 0; '
-            f'border:1px solid #ddd; border-radius:12px; font-size:11px; color:#555;">'
-            f'{html_escape(tag)}</span>'
+            f'{TAG_PILL_OPEN}{html_escape(tag)}</span>'
             for tag in tags[:4]
         )
         tags_html = f'<div style="margin-top:12px;">{tags_pills}</div>'
@@ -528,10 +805,10 @@ def hero_card_html(a: Article, s: Dict[str, Any], feedback_html: str = "") -> st
     return f"""
     <div style="border:1px solid #e0e0e0; border-radius:8px; padding:24px; margin:16px 0; background:#ffffff; box-shadow:0 2px 4px rgba(0,0,0,0.06);">
       <div style="font-size:17px; font-weight:600; line-height:1.4; margin-bottom:6px;">
-        <a href="{url}" style="color:#1a1a1a; text-decoration:none;">{title}</a>{rct_badge}
+        <a href="{a.url_html}" style="color:#1a1a1a; text-decoration:none;">{a.title_html}</a>{rct_badge}
       </div>
       <div style="font-size:12px; color:#888; margin-bottom:20px;">
-        {meta_line}
+        {a.meta_html}
       </div>
 
       <div style="margin-bottom:16px;">
@@ -568,30 +845,13 @@ def headlines_html(items: List[Article], feedback_map: Optional[Dict[str, str]]
     feedback_map = feedback_map or {}
     lis = []
     for a in items:
-        title = html_escape(strip_control_chars(a.title))
-        journal = html_escape(a.journal)
-        pub_date = html_escape(a.pub_date)
-        url = html_escape(a.url)
-        authors = html_escape(", ".join(a.authors)) if a.authors else ""
-
-        rct_badge = ""
-        if is_rct(a):
-            rct_badge = (
-                '<span style="display:inline-block; padding:2px 6px; '
-                'background:#e8f5e9; color:#2e7d32; font-size:9px; '
-                'font-weight:600; border-radius:3px; margin-left:6px;">RCT</span>'
-            )
-
-        # Build meta line: journal · date · authors
-        meta_parts = [p for p in [journal, pub_date, authors] if p]
-        meta_line = " · ".join(meta_parts)
-
+        rct_badge = RCT_BADGE_SMALL if a.is_rct else ""
         feedback_html = feedback_map.get(a.pmid, "")
 
         lis.append(f"""
             <li style='margin:10px 0; padding:10px 0; border-bottom:1px solid #f0f0f0; line-height:1.5;'>
-                <a href='{url}' style='color:#2c2c2c; text-decoration:none; font-size:14px;'>{title}</a>{rct_badge}
-                <div style='color:#888; font-size:12px; margin-top:4px;'>{meta_line}</div>
+                <a href='{a.url_html}' style='color:#2c2c2c; text-decoration:none; font-size:14px;'>{a.title_html}</a>{rct_badge}
+                <div style='color:#888; font-size:12px; margin-top:4px;'>{a.meta_html}</div>
                 {feedback_html}
             </li>
         """)
@@ -647,6 +907,11 @@ def your_saves_html(saves: List[SavedArticle], view_saves_url: str = "") -> str:
 UNSUBSCRIBE_URL = "https://forms.gle/WgPF48warDt51Pfi8"
 
 
+# Placeholder left where an article's feedback links go, so shared HTML can be rendered once
+FEEDBACK_MARKER = "<!--FB:{pmid}-->"
+FEEDBACK_MARKER_RE = re.compile(r"<!--FB:(.*?)-->")
+
+
 def build_feedback_links(pmid: str, title: str, user_email: str, webhook_url: str) -> str:
     """Build 'Was this useful? Yes · No' feedback links for an article."""
     if not webhook_url:
@@ -690,9 +955,10 @@ def build_email_html(
     your_saves_block: str = "",
     view_saves_url: str = "",
     specialty_name: str = "Cardiology",
+    human_date: str = "",
 ) -> str:
     """Email template with personalized greeting and optional saved articles."""
-    human_date = format_human_date(generated_at)
+    human_date = human_date or format_human_date(generated_at)
     specialty_lower = specialty_name.lower()
 
     rct_note = ""
@@ -768,40 +1034,204 @@ def build_email_html(
 """
 
 
+def build_email_text(
+    generated_at: str,
+    summaries: List[Tuple[Article, Dict[str, Any]]],
+    headlines: List[Article],
+    total_articles: int,
+    rct_count: int,
+    firstname: str = "",
+    specialty_name: str = "Cardiology",
+    human_date: str = "",
+) -> str:
+    """Plain-text version of the digest for the multipart/alternative fallback."""
+    rct_note = f" · {rct_count} RCT{'s' if rct_count != 1 else ''}" if rct_count > 0 else ""
+    lines = [
+        f"Hi {firstname}," if firstname else "Hi,",
+        f"This is your weekly {specialty_name.lower()} digest. Enjoy!",
+        "",
+        f"WEEKLY {specialty_name.upper()} DIGEST",
+        f"{human_date or format_human_date(generated_at)} · {total_articles} articles · {len(summaries)} featured{rct_note}",
+        "",
+        "FEATURED STUDIES",
+        "",
+    ]
+
+    def article_lines(a: Article) -> List[str]:
+        meta = " · ".join(p for p in [a.journal, a.pub_date, ", ".join(a.authors)] if p)
+        title = strip_control_chars(a.title) + (" [RCT]" if a.is_rct else "")
+        return [f"• {title}"] + ([f"  {meta}"] if meta else [])
+
+    if not summaries:
+        lines += ["No featured studies this week.", ""]
+    for a, s in summaries:
+        lines += article_lines(a)
+        lines += [
+            f"  Study type: {strip_control_chars(normalize_study_type(s.get('study_type', '')))}",
+            f"  Context: {strip_control_chars(s.get('context', ''))}",
+            f"  Finding: {strip_control_chars(s.get('finding', ''))}",
+            f"  So what? {strip_control_chars(s.get('so_what', ''))}",
+            f"  {a.url}",
+            "",
+        ]
+
+    lines += ["OTHER PAPERS", ""]
+    if not headlines:
+        lines += ["No additional headlines this week.", ""]
+    for a in headlines:
+        lines += article_lines(a) + [f"  {a.url}", ""]
+
+    lines += [
+        "Summaries automatically generated from abstracts. Refer to original publications for full details.",
+        f"Unsubscribe: {UNSUBSCRIBE_URL}",
+    ]
+    return "\n".join(lines) + "\n"
+
+
 # ----------------------------
 # Gmail SMTP sending
 # ----------------------------
-def send_gmail_html(
-    smtp_user: str,
-    smtp_app_password: str,
+def build_html_message(
     to_addr: str,
     from_addr: str,
     subject: str,
     html_body: str,
     from_name: str = "",
-) -> None:
-    msg = MIMEMultipart("alternative")
+    text_body: str = "",
+) -> str:
+    """
+    Build the email and serialise it, ready for SMTP.
+
+    With text_body this is multipart/alternative (plain text + HTML); otherwise a single text/html part.
+    """
+    msg: Any
+    if text_body:
+        msg = MIMEMultipart("alternative")
+        msg.attach(MIMEText(text_body, "plain", "utf-8"))
+        msg.attach(MIMEText(html_body, "html", "utf-8"))
+    else:
+        msg = MIMEText(html_body, "html", "utf-8")
     msg["Subject"] = subject
     msg["From"] = f'"{from_name}" <{from_addr}>' if from_name else from_addr
     msg["To"] = to_addr
+    return msg.as_string()
 
-    msg.attach(MIMEText("Your email client does not support HTML.", "plain", "utf-8"))
-    msg.attach(MIMEText(html_body, "html", "utf-8"))
 
-    context = ssl.create_default_context()
+class GmailSender:
+    """
+    Gmail SMTP session that does the STARTTLS + login handshake once.
+
+    Use as a context manager and call send() for each message; the connection is
+    opened on the first send, recycled every max_messages sends, and reopened
+    if Gmail drops it:
+
+        with GmailSender(user, app_password) as sender:
+            sender.send(from_addr, to_addr, message)
+    """
+
+    def __init__(
+        self,
+        smtp_user: str,
+        smtp_app_password: str,
+        timeout: float = 30,
+        max_messages: int = 100,
+    ) -> None:
+        self.smtp_user = smtp_user
+        self.smtp_app_password = smtp_app_password
+        self.timeout = timeout
+        self.max_messages = max_messages
+        self.server: Optional[smtplib.SMTP] = None
+        self.sent_on_session = 0
+
+    def connect(self) -> None:
+        server = smtplib.SMTP("smtp.gmail.com", 587, timeout=self.timeout)
+        try:
+            server.ehlo()
+            server.starttls(context=ssl.create_default_context())
+            server.ehlo()
+            server.login(self.smtp_user, self.smtp_app_password)
+        except BaseException:
+            server.close()
+            raise
+        self.server = server
+        self.sent_on_session = 0
+
+    def close(self) -> None:
+        if self.server is None:
+            return
+        try:
+            self.server.quit()
+        except (smtplib.SMTPException, OSError):
+            self.server.close()
+        self.server = None
+
+    def send(self, from_addr: str, to_addr: str, message: str) -> None:
+        if self.server is not None and self.sent_on_session >= self.max_messages:
+            self.close()
+        if self.server is None:
+            self.connect()
+        try:
+            cast(smtplib.SMTP, self.server).sendmail(from_addr, [to_addr], message)
+        except smtplib.SMTPServerDisconnected:
+            # Idle timeout or server-side limit: reconnect once and retry this message
+            cast(smtplib.SMTP, self.server).close()
+            self.connect()
+            cast(smtplib.SMTP, self.server).sendmail(from_addr, [to_addr], message)
+        self.sent_on_session += 1
+
+    def __enter__(self) -> "GmailSender":
+        return self
 
-    with smtplib.SMTP("smtp.gmail.com", 587, timeout=30) as server:
-        server.ehlo()
-        server.starttls(context=context)
-        server.ehlo()
-        server.login(smtp_user, smtp_app_password)
-        server.sendmail(from_addr, [to_addr], msg.as_string())
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+
+class TokenBucket:
+    """
+    Rate limiter allowing bursts of up to `burst` calls, refilled at `rate` per second.
+
+    acquire() only sleeps once the bucket is empty, so short fan-outs go out back-to-back
+    while long ones settle at `rate`.
+    """
+
+    def __init__(self, rate: float, burst: int = 1) -> None:
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.tokens = float(self.burst)
+        self.last = time.monotonic()
+
+    def acquire(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.last) * self.rate)
+        self.last = now
+        if self.tokens < 1:
+            wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+            self.last = now + wait
+            self.tokens = 1.0
+        self.tokens -= 1
+
+
+def send_gmail_html(
+    smtp_user: str,
+    smtp_app_password: str,
+    to_addr: str,
+    from_addr: str,
+    subject: str,
+    html_body: str,
+    from_name: str = "",
+    text_body: str = "",
+) -> None:
+    # Serialise before connecting so the SMTP session isn't held open while encoding
+    message = build_html_message(to_addr, from_addr, subject, html_body, from_name, text_body)
+    with GmailSender(smtp_user, smtp_app_password) as sender:
+        sender.send(from_addr, to_addr, message)
 
 
 # ----------------------------
 # Main
 # ----------------------------
-def main() -> int:
+def main(argv: Optional[List[str]] = None) -> int:
     ap = argparse.ArgumentParser(description="Summarise latest digest JSON and send as HTML email")
     ap.add_argument("--specialty", type=str, default="cardiology",
                     help="Specialty to run (default: cardiology). Loads config from specialties/{specialty}.json")
@@ -809,7 +1239,16 @@ def main() -> int:
                     help="Path to latest JSON. Defaults to output/{specialty}_recent.json or LATEST_JSON env var")
     ap.add_argument("--sent-state", type=str, default=None,
                     help="Path to sent state file. Defaults to state/sent_pmids.json (cardiology) or state/{specialty}_sent_pmids.json")
+    ap.add_argument("--summary-cache", type=str, default=None,
+                    help="Path to summary cache file, also written on --dry-run/--no-send runs. "
+                         "Defaults to cache/summary_cache.json (cardiology) or cache/{specialty}_summary_cache.json")
     ap.add_argument("--max-summaries", type=int, default=10)
+    ap.add_argument("--summary-workers", type=int, default=8,
+                    help="Concurrent OpenAI summary requests (default: 8)")
+    ap.add_argument("--use-batch-api", action="store_true",
+                    help="Summarise via the OpenAI Batch API (half price; may take minutes to hours)")
+    ap.add_argument("--batch-timeout", type=float, default=3600.0,
+                    help="Seconds to wait for a Batch API job before falling back to direct requests (default: 3600)")
     ap.add_argument("--dry-run", action="store_true", help="Do not send email; write HTML preview to output/email_preview.html")
     ap.add_argument("--subject", type=str, default=None)
     ap.add_argument("--preview-firstname", type=str, default="",
@@ -823,8 +1262,10 @@ def main() -> int:
     except ValueError:
         default_delay = 0.0
     ap.add_argument("--send-delay", type=float, default=default_delay,
-                    help="Delay (seconds) between per-recipient sends (default: 0)")
-    args = ap.parse_args()
+                    help="Average delay (seconds) between per-recipient sends once the burst is used (default: 1.5)")
+    ap.add_argument("--send-burst", type=int, default=20,
+                    help="Sends allowed back-to-back before --send-delay pacing applies (default: 20; 1 = always pace)")
+    args = ap.parse_args(argv)
 
     # Load specialty config
     try:
@@ -849,6 +1290,13 @@ def main() -> int:
     else:
         sent_state_path = Path(f"state/{args.specialty}_sent_pmids.json")
 
+    if args.summary_cache:
+        summary_cache_path = Path(args.summary_cache)
+    elif args.specialty == "cardiology":
+        summary_cache_path = Path("cache/summary_cache.json")
+    else:
+        summary_cache_path = Path(f"cache/{args.specialty}_summary_cache.json")
+
     if not latest_path.exists():
         print(f"❌ Latest JSON not found: {latest_path}", file=sys.stderr)
         return 1
@@ -877,7 +1325,7 @@ def main() -> int:
         return 0
 
     # Count RCTs for reporting
-    rct_count = sum(1 for a in unsent if is_rct(a))
+    rct_count = sum(1 for a in unsent if a.is_rct)
 
     to_sum, headlines_only = select_for_summary(unsent, max_summaries=args.max_summaries)
 
@@ -889,16 +1337,47 @@ def main() -> int:
     model = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
     print(f"📡 Using model: {model}")
 
-    client = OpenAI(api_key=openai_key)
+    # The SDK retries 429/5xx/connection errors with backoff, so a transient blip doesn't drop an article
+    client = OpenAI(api_key=openai_key, max_retries=5, timeout=60.0)
 
-    summaries: List[Tuple[Article, Dict[str, Any]]] = []
+    specialty_label = specialty_config.get("name", "cardiology")
+
+    # Reuse summaries from earlier runs (e.g. a retry after an SMTP failure); skip in test mode.
+    # Dry runs read and write it too, so iterating on a preview pays for each summary once.
+    now_iso = datetime.now(timezone.utc).isoformat()
+    summary_cache = {} if args.test_mode else load_summary_cache(summary_cache_path)
+    cache_keys = {a.pmid: summary_cache_key(summary_request_body(model, a, specialty_label)) for a in to_sum}
+    cached: Dict[str, Dict[str, Any]] = {}
     for a in to_sum:
+        entry = summary_cache.get(cache_keys[a.pmid])
+        if isinstance(entry, dict) and isinstance(entry.get("summary"), dict):
+            cached[a.pmid] = entry["summary"]
+            entry["cached_at"] = now_iso  # reused entries count as recent for eviction
+    to_request = [a for a in to_sum if a.pmid not in cached]
+    if cached:
+        print(f"💾 Reusing {len(cached)} cached summaries")
+
+    fresh: Optional[List[Tuple[Article, Dict[str, Any]]]] = None
+    if args.use_batch_api and to_request:
         try:
-            print(f"  Summarising: {a.pmid} — {a.title[:60]}...")
-            s = summarise_one(client, model, a, specialty_config.get("name", "cardiology"))
-            summaries.append((a, s))
+            fresh = summarise_batch(client, model, to_request, specialty_label, timeout_s=args.batch_timeout)
         except Exception as e:
-            print(f"⚠️ Summary failed for PMID {a.pmid}: {e}", file=sys.stderr)
+            print(f"⚠️ Batch API unavailable ({e}); falling back to direct requests", file=sys.stderr)
+    if fresh is None:
+        fresh = summarise_all(client, model, to_request, specialty_label, max_workers=args.summary_workers)
+
+    # Also save cache-only runs so the refreshed cached_at of reused entries drives eviction
+    if (fresh or cached) and not args.test_mode:
+        for a, s in fresh:
+            summary_cache[cache_keys[a.pmid]] = {"pmid": a.pmid, "cached_at": now_iso, "summary": s}
+        save_summary_cache(summary_cache_path, summary_cache)
+
+    fresh_by_pmid = {a.pmid: s for a, s in fresh}
+    summaries = [
+        (a, cached[a.pmid] if a.pmid in cached else fresh_by_pmid[a.pmid])
+        for a in to_sum
+        if a.pmid in cached or a.pmid in fresh_by_pmid
+    ]
 
     if not summaries and not headlines_only:
         print("⚠️ No summaries generated and no headlines. Skipping email.")
@@ -906,13 +1385,12 @@ def main() -> int:
 
     # Build HTML
     # Format date as "Jan 10, 2026"
-    subject_date = format_human_date(generated_at).replace(" 0", " ").lstrip("0")  # Remove leading zeros
+    human_date = format_human_date(generated_at)
     try:
-        from datetime import datetime as dt
-        parsed = dt.fromisoformat(generated_at.replace("Z", "+00:00"))
+        parsed = datetime.fromisoformat(generated_at.replace("Z", "+00:00"))
         subject_date = parsed.strftime("%b %d, %Y").replace(" 0", " ")
     except Exception:
-        pass
+        subject_date = human_date.replace(" 0", " ").lstrip("0")  # Remove leading zeros
     email_subject_prefix = specialty_config.get("email_subject_prefix", "Weekly Digest")
     subject = args.subject or f"{email_subject_prefix} — {subject_date}"
 
@@ -926,28 +1404,45 @@ def main() -> int:
         feedback_webhook_url = ""
         print(f"📊 Feedback disabled for {specialty_config.get('name', args.specialty)}")
 
+    # Read the feedback sheet once for all recipients rather than once per recipient
+    saves_by_email = fetch_all_user_saves() if enable_feedback else {}
+
+    # Cards and headlines only differ per recipient in their feedback links: render them once
+    # with a marker per article, split on the markers, and splice each recipient's links in.
+    def feedback_marker(pmid: str) -> str:
+        return FEEDBACK_MARKER.format(pmid=pmid) if feedback_webhook_url else ""
+
+    cards_parts = FEEDBACK_MARKER_RE.split("".join(
+        hero_card_html(a, s, feedback_marker(a.pmid))
+        for a, s in summaries
+    ))
+    headlines_parts = FEEDBACK_MARKER_RE.split(
+        headlines_html(headlines_only, {a.pmid: feedback_marker(a.pmid) for a in headlines_only})
+    )
+    titles_by_pmid = {a.pmid: a.title for a in to_sum + headlines_only}
+
+    def with_feedback(parts: List[str], user_email: str) -> str:
+        """Join split HTML, filling odd (PMID) slots with this user's feedback links."""
+        if len(parts) == 1:
+            return parts[0]
+        filled = list(parts)
+        for i in range(1, len(parts), 2):
+            pmid = parts[i]
+            filled[i] = (
+                build_feedback_links(pmid, titles_by_pmid[pmid], user_email, feedback_webhook_url)
+                if user_email else ""
+            )
+        return "".join(filled)
+
     def build_personalized_content(user_email: str, firstname: str) -> str:
         """Build fully personalized email HTML for a specific user."""
-        # Build feedback links for each article
-        def get_feedback_html(pmid: str, title: str) -> str:
-            if not feedback_webhook_url or not user_email:
-                return ""
-            return build_feedback_links(pmid, title, user_email, feedback_webhook_url)
-
-        # Build hero cards with feedback links
-        cards_html = "".join(
-            hero_card_html(a, s, get_feedback_html(a.pmid, a.title))
-            for a, s in summaries
-        )
-
-        # Build headlines with feedback links
-        feedback_map = {a.pmid: get_feedback_html(a.pmid, a.title) for a in headlines_only}
-        headlines_block = headlines_html(headlines_only, feedback_map)
+        cards_html = with_feedback(cards_parts, user_email)
+        headlines_block = with_feedback(headlines_parts, user_email)
 
         # Build view saves URL and fetch saves only if feedback is enabled
         if enable_feedback:
             view_saves_url = build_view_saves_url(user_email, feedback_webhook_url)
-            user_saves = fetch_user_saves(user_email) if user_email else []
+            user_saves = saves_by_email.get(user_email.lower().strip(), []) if user_email else []
             saves_block = your_saves_html(user_saves, view_saves_url)
         else:
             view_saves_url = ""
@@ -965,6 +1460,19 @@ def main() -> int:
             your_saves_block=saves_block,
             view_saves_url=view_saves_url,
             specialty_name=specialty_config.get("name", "Cardiology"),
+            human_date=human_date,
+        )
+
+    def build_personalized_text(firstname: str) -> str:
+        return build_email_text(
+            generated_at=generated_at,
+            summaries=summaries,
+            headlines=headlines_only,
+            total_articles=len(unsent),
+            rct_count=rct_count,
+            firstname=firstname,
+            specialty_name=specialty_config.get("name", "Cardiology"),
+            human_date=human_date,
         )
 
     if args.dry_run:
@@ -973,6 +1481,7 @@ def main() -> int:
         preview_path = Path("output/email_preview.html")
         preview_path.parent.mkdir(parents=True, exist_ok=True)
         preview_path.write_text(html_body, encoding="utf-8")
+        preview_path.with_suffix(".txt").write_text(build_personalized_text(preview_firstname), encoding="utf-8")
         print(f"✅ Dry run: wrote HTML preview to {preview_path}")
         return 0
 
@@ -997,30 +1506,33 @@ def main() -> int:
         print("❌ Missing Gmail/email env vars or no subscribers. Need GMAIL_SMTP_USER, GMAIL_SMTP_APP_PASSWORD, and either GOOGLE_SHEET_ID+GOOGLE_CREDENTIALS or EMAIL_TO.", file=sys.stderr)
         return 1
 
+    # Build specialty-specific sender name
+    specialty_name = specialty_config.get("name", "Cardiology")
+    default_sender = f"Ike Chukwudi | {specialty_name} Digest"
+    sender_name = os.getenv("EMAIL_FROM_NAME", default_sender)
+
     sent_count = 0
     delay_s = max(0.0, args.send_delay or 0.0)
-    for email, firstname in recipients:
-        if not email:
-            continue
-        personalized_html = build_personalized_content(email, firstname)
-        if not args.no_send:
-            # Build specialty-specific sender name
-            specialty_name = specialty_config.get("name", "Cardiology")
-            default_sender = f"Ike Chukwudi | {specialty_name} Digest"
-            sender_name = os.getenv("EMAIL_FROM_NAME", default_sender)
-
-            send_gmail_html(
-                smtp_user=smtp_user,
-                smtp_app_password=smtp_app_password,
-                to_addr=email,
-                from_addr=from_addr,
-                subject=subject,
-                html_body=personalized_html,
-                from_name=sender_name,
-            )
-        sent_count += 1
-        if delay_s > 0 and not args.no_send:
-            time.sleep(delay_s)
+    send_bucket = TokenBucket(rate=1.0 / delay_s, burst=args.send_burst) if delay_s > 0 else None
+    # One SMTP session (one TLS handshake + login) for the whole fan-out
+    with GmailSender(smtp_user, smtp_app_password) as sender:
+        for email, firstname in recipients:
+            if not email:
+                continue
+            personalized_html = build_personalized_content(email, firstname)
+            if not args.no_send:
+                message = build_html_message(
+                    to_addr=email,
+                    from_addr=from_addr,
+                    subject=subject,
+                    html_body=personalized_html,
+                    from_name=sender_name,
+                    text_body=build_personalized_text(firstname),
+                )
+                if send_bucket:
+                    send_bucket.acquire()
+                sender.send(from_addr, email, message)
+            sent_count += 1
 
     # Update sent PMIDs only after successful send (skip in test mode)
     if not args.test_mode and not args.no_send: